@@ -1,11 +1,11 @@
 from flask import Flask, render_template, url_for, jsonify, request, make_response, g
 from utils import initialize_database
-from utils.database import DatabaseHandler, add_progression_goals_table, add_volume_tracking_tables
+from utils.database import DatabaseHandler, add_progression_goals_table, add_volume_tracking_tables, close_idle_connections
 from routes.workout_log import workout_log_bp
 from routes.weekly_summary import weekly_summary_bp
 from routes.session_summary import session_summary_bp
 from routes.exports import exports_bp
-from routes.filters import filters_bp
+from routes.filters import filters_bp, warm_unique_values
 from routes.workout_plan import workout_plan_bp, initialize_exercise_order
 from routes.main import main_bp
 from routes.progression_plan import progression_plan_bp
@@ -70,6 +70,10 @@ app.register_blueprint(progression_plan_bp)
 app.register_blueprint(volume_splitter_bp)
 app.register_blueprint(program_backup_bp)
 
+# Build the exercise dropdown payloads before the first page load asks for them
+with app.app_context():
+    warm_unique_values()
+
 # Log registered routes (debug level only)
 logger.debug("Registered routes:")
 for rule in app.url_map.iter_rules():
@@ -233,6 +237,8 @@ if __name__ == "__main__":
             # Checkpoint any open WAL files
             with DatabaseHandler() as db:
                 db.connection.execute("PRAGMA wal_checkpoint(TRUNCATE);")
+            # Pooled connections checkpoint again as they close
+            close_idle_connections()
             logger.info("Database cleanup completed on exit")
         except Exception as e:
             logger.warning(f"Error during cleanup: {e}")
@@ -1,5 +1,5 @@
 from flask import Blueprint, Response, jsonify, request, make_response
-from utils.database import DatabaseHandler
+from utils.database import DatabaseHandler, configure_bulk_connection
 from utils.export_utils import (
     create_excel_workbook,
     sanitize_filename,
@@ -17,6 +17,7 @@ from utils.weekly_summary import (
 from utils.errors import error_response, success_response
 from utils.logger import get_logger
 import logging
+import sqlite3
 
 exports_bp = Blueprint('exports', __name__)
 logger = get_logger()
@@ -81,7 +82,10 @@ DB_TO_ADVANCED_MUSCLE = {
 }
 
 # Columns that contain muscle names and should be transformed in advanced view
-MUSCLE_COLUMNS = ['primary_muscle_group', 'secondary_muscle_group', 'tertiary_muscle_group']
+MUSCLE_COLUMNS = frozenset(['primary_muscle_group', 'secondary_muscle_group', 'tertiary_muscle_group'])
+
+# Internal columns never written to the exported sheets
+EXCLUDED_EXPORT_COLUMNS = frozenset(['id', 'sort_order'])
 
 # Column configuration for export matching UI table order
 # Maps database column names to display names for each view mode
@@ -161,33 +165,13 @@ WORKOUT_PLAN_COLUMNS = {
 }
 
 
-def transform_muscle_value(value, view_mode):
-    """
-    Transform a muscle name value based on view mode.
-    
-    In advanced mode, transforms simple names like 'Chest' to scientific names
-    like 'Upper / Lower Pectoralis'.
-    
-    Args:
-        value: The muscle name value from the database
-        view_mode: 'simple' or 'advanced'
-        
-    Returns:
-        Transformed value (or original if no transformation needed)
-    """
-    if view_mode != 'advanced' or not value:
-        return value
-    
-    return DB_TO_ADVANCED_MUSCLE.get(value, value)
-
-
 def reorder_and_rename_columns(data, column_config, view_mode='simple'):
     """
     Reorder columns to match UI table order and rename based on view mode.
     Also transforms muscle name values in advanced mode.
     
     Args:
-        data: List of row dictionaries from database
+        data: List of row dictionaries or sqlite3.Row objects from database
         column_config: Configuration dict with 'order' and view mode mappings
         view_mode: 'simple' or 'advanced'
         
@@ -200,83 +184,305 @@ def reorder_and_rename_columns(data, column_config, view_mode='simple'):
     column_order = column_config['order']
     display_names = column_config.get(view_mode, column_config.get('simple', {}))
     
-    reordered_data = []
-    for row in data:
-        new_row = {}
-        for col in column_order:
-            if col in row:
-                display_name = display_names.get(col, col)
-                value = row[col]
-                # Transform muscle values in advanced mode
-                if col in MUSCLE_COLUMNS:
-                    value = transform_muscle_value(value, view_mode)
-                new_row[display_name] = value
-        # Add any remaining columns not in the defined order (at the end)
-        for key, value in row.items():
-            display_name = display_names.get(key, key)
-            if display_name not in new_row and key not in ['id', 'sort_order']:
-                new_row[display_name] = value
-        reordered_data.append(new_row)
+    # Muscle values are only renamed in advanced view; decide that once
+    advanced = view_mode == 'advanced'
+    
+    # Every row comes from the same query, so the first row's keys decide the
+    # (source, display name, map muscle value) plan once for the whole export
+    row_keys = list(data[0].keys())
+    present = set(row_keys)
+    plan = [
+        (col, display_names.get(col, col), advanced and col in MUSCLE_COLUMNS)
+        for col in column_order if col in present
+    ]
+    # Remaining columns not in the defined order are appended at the end
+    ordered = set(column_order)
+    used_names = {display_name for _, display_name, _ in plan}
+    extra_columns = [
+        key for key in row_keys
+        if key not in ordered and key not in EXCLUDED_EXPORT_COLUMNS
+        and display_names.get(key, key) not in used_names
+    ]
+    plan.extend((key, display_names.get(key, key), False) for key in extra_columns)
+    
+    advanced_name = DB_TO_ADVANCED_MUSCLE.get  # bound once, not per cell
+    reordered_data = [
+        {
+            display_name: advanced_name(row[col], row[col]) if map_muscle else row[col]
+            for col, display_name, map_muscle in plan
+        }
+        for row in data
+    ]
     
     return reordered_data
 
+def _nulls_first(value):
+    """Sort key placing None before any value, as SQLite's ORDER BY does."""
+    return (value is not None, value)
+
+
+def order_plan_supersets(rows):
+    """
+    Order workout plan rows so superset members sit together.
+    
+    Within each routine, a superset is placed at the position of its
+    lowest exercise_order, ahead of any non-superset exercise with the same
+    order; members follow each other by exercise_order, then name.
+    
+    Args:
+        rows: Plan rows with routine, exercise, superset_group and exercise_order
+        
+    Returns:
+        New list of the rows in export order
+    """
+    group_start = {}
+    for row in rows:
+        group, order = row['superset_group'], row['exercise_order']
+        if group is not None and order is not None:
+            key = (row['routine'], group)
+            if key not in group_start or order < group_start[key]:
+                group_start[key] = order
+    
+    def sort_key(row):
+        group = row['superset_group']
+        if group is None:
+            position, grouped = row['exercise_order'], 1
+        else:
+            position, grouped = group_start.get((row['routine'], group)), 0
+        return (
+            _nulls_first(row['routine']),
+            _nulls_first(position),
+            grouped,
+            _nulls_first(group),
+            _nulls_first(row['exercise_order']),
+            _nulls_first(row['exercise']),
+        )
+    
+    # Input already arrives sorted by (routine, exercise_order), which keeps
+    # this sort close to linear
+    return sorted(rows, key=sort_key)
+
 # Removed verbose before_request logging - using logger only
 
-def calculate_volume_for_category(category, muscle_group):
+# Export queries are built once at import; LIMIT is bound to MAX_EXPORT_ROWS per execute.
+# superset_group is always present (db_initializer adds it); only exercise_order
+# is optional, so the plan query has one select list and two orderings.
+WORKOUT_PLAN_SELECT = """
+    us.routine,
+    us.exercise,
+    e.primary_muscle_group,
+    e.secondary_muscle_group,
+    e.tertiary_muscle_group,
+    e.advanced_isolated_muscles,
+    e.utility,
+    e.movement_pattern,
+    e.movement_subpattern,
+    us.sets,
+    us.min_rep_range,
+    us.max_rep_range,
+    us.rir,
+    us.rpe,
+    us.weight,
+    us.execution_style,
+    e.grips,
+    e.stabilizers,
+    e.synergists,
+    us.superset_group"""
+
+# Rows come back in plain (routine, exercise_order) order; superset members
+# are pulled together afterwards by order_plan_supersets
+WORKOUT_PLAN_ORDERED_QUERY = f"""
+SELECT {WORKOUT_PLAN_SELECT},
+    us.exercise_order
+FROM user_selection us
+LEFT JOIN exercises e ON us.exercise = e.exercise_name
+ORDER BY us.routine, us.exercise_order, us.exercise
+"""
+
+# Fallback for databases that predate the exercise_order column
+WORKOUT_PLAN_BASIC_QUERY = f"""
+SELECT {WORKOUT_PLAN_SELECT}
+FROM user_selection us
+LEFT JOIN exercises e ON us.exercise = e.exercise_name
+ORDER BY us.routine, us.exercise
+"""
+
+WORKOUT_LOG_EXPORT_QUERY = """
+SELECT * FROM workout_log 
+ORDER BY created_at DESC
+LIMIT ?
+"""
+
+SESSION_SUMMARY_EXPORT_QUERY = """
+SELECT 
+    date(wl.created_at) as session_date,
+    wl.routine,
+    wl.exercise,
+    e.primary_muscle_group,
+    e.secondary_muscle_group,
+    e.tertiary_muscle_group,
+    e.advanced_isolated_muscles,
+    wl.planned_sets,
+    wl.planned_min_reps,
+    wl.planned_max_reps,
+    wl.planned_weight,
+    wl.planned_rir,
+    wl.planned_rpe,
+    wl.scored_weight,
+    wl.scored_max_reps,
+    wl.scored_rir,
+    wl.scored_rpe
+FROM workout_log wl
+LEFT JOIN exercises e ON wl.exercise = e.exercise_name
+WHERE (
+    wl.scored_weight IS NOT NULL
+    OR wl.scored_max_reps IS NOT NULL
+    OR wl.planned_weight IS NOT NULL
+    OR wl.planned_sets IS NOT NULL
+)
+AND wl.routine IS NOT NULL
+ORDER BY wl.created_at DESC
+LIMIT ?
+"""
+
+PROGRESSION_GOALS_EXPORT_QUERY = """
+SELECT 
+    exercise,
+    goal_type,
+    current_value,
+    target_value,
+    goal_date,
+    completed,
+    created_at
+FROM progression_goals
+ORDER BY created_at DESC
+"""
+
+# Copies the whole plan server-side; no rows round-trip through Python
+WORKOUT_PLAN_TO_LOG_QUERY = """
+INSERT INTO workout_log (
+    workout_plan_id, routine, exercise, planned_sets, planned_min_reps,
+    planned_max_reps, planned_rir, planned_rpe, planned_weight, created_at
+)
+SELECT id, routine, exercise, sets, min_rep_range, max_rep_range,
+       rir, rpe, weight, CURRENT_TIMESTAMP
+FROM user_selection
+"""
+
+STREAMED_SESSION_SUMMARY_QUERY = """
+SELECT 
+    date(wl.created_at) as session_date,
+    wl.routine,
+    wl.exercise,
+    e.primary_muscle_group,
+    e.secondary_muscle_group,
+    wl.planned_sets,
+    wl.planned_min_reps,
+    wl.planned_max_reps,
+    wl.planned_weight,
+    wl.scored_weight,
+    wl.scored_max_reps
+FROM workout_log wl
+LEFT JOIN exercises e ON wl.exercise = e.exercise_name
+WHERE wl.scored_weight IS NOT NULL
+   OR wl.scored_max_reps IS NOT NULL
+ORDER BY wl.created_at DESC
+LIMIT ?
+"""
+
+# UPDATE ... FROM needs SQLite 3.33+; older libraries get the correlated-subquery
+# form, which numbers each row by counting the rows at or before it.
+_ORDER_RECALC_UPDATE_FROM = """
+UPDATE user_selection
+SET exercise_order = numbered.rn
+FROM (
+    SELECT id, ROW_NUMBER() OVER (ORDER BY routine, exercise, id) AS rn
+    FROM user_selection
+) AS numbered
+WHERE user_selection.id = numbered.id
+"""
+
+_ORDER_RECALC_CORRELATED = """
+UPDATE user_selection
+SET exercise_order = (
+    SELECT COUNT(*) FROM user_selection AS earlier
+    WHERE (earlier.routine, earlier.exercise, earlier.id)
+       <= (user_selection.routine, user_selection.exercise, user_selection.id)
+)
+"""
+
+EXERCISE_ORDER_RECALC_QUERY = (
+    _ORDER_RECALC_UPDATE_FROM if sqlite3.sqlite_version_info >= (3, 33, 0)
+    else _ORDER_RECALC_CORRELATED
+)
+
+# One row per (exercise, muscle) pair across the three muscle-group columns and
+# the isolated-muscle mapping. UNION (not UNION ALL) keeps each workout_log row
+# counted once per muscle, matching the old per-muscle OR predicate.
+VOLUME_AND_FREQUENCY_QUERY = """
+WITH logged AS (
+    SELECT DISTINCT exercise AS exercise_name FROM workout_log
+),
+exercise_muscles AS (
+    SELECT e.exercise_name, e.primary_muscle_group AS muscle
+    FROM logged JOIN exercises e USING (exercise_name)
+    WHERE e.primary_muscle_group IS NOT NULL
+    UNION
+    SELECT e.exercise_name, e.secondary_muscle_group
+    FROM logged JOIN exercises e USING (exercise_name)
+    WHERE e.secondary_muscle_group IS NOT NULL
+    UNION
+    SELECT e.exercise_name, e.tertiary_muscle_group
+    FROM logged JOIN exercises e USING (exercise_name)
+    WHERE e.tertiary_muscle_group IS NOT NULL
+    UNION
+    SELECT m.exercise_name, m.muscle
+    FROM logged JOIN exercise_isolated_muscles m USING (exercise_name)
+)
+SELECT
+    em.muscle,
+    SUM(wl.scored_weight * wl.scored_max_reps * wl.planned_sets) AS total_volume,
+    COUNT(DISTINCT CASE
+        WHEN wl.created_at >= date('now', '-7 days') THEN date(wl.created_at)
+    END) AS frequency
+FROM workout_log wl
+JOIN exercise_muscles em ON wl.exercise = em.exercise_name
+GROUP BY em.muscle
+"""
+
+
+def calculate_volume_and_frequency_bulk(db=None):
+    """
+    Calculate total volume and 7-day training frequency for every muscle at once.
+
+    Args:
+        db: Optional open DatabaseHandler to reuse; a new one is opened otherwise.
+
+    Returns:
+        Dict mapping muscle name to {'total_volume': ..., 'frequency': ...}.
+    """
+    if db is None:
+        with DatabaseHandler() as handler:
+            return calculate_volume_and_frequency_bulk(handler)
+
+    return {
+        row['muscle']: {
+            'total_volume': row['total_volume'] or 0,
+            'frequency': row['frequency'] or 0,
+        }
+        for row in db.fetch_all(VOLUME_AND_FREQUENCY_QUERY)
+    }
+
+
+def calculate_volume_for_category(category, muscle_group, db=None):
     """Calculate total volume for a muscle group category."""
-    try:
-        with DatabaseHandler() as db:
-            query = """
-            SELECT SUM(scored_weight * scored_max_reps * planned_sets) as total_volume
-            FROM workout_log wl
-            JOIN exercises e ON wl.exercise = e.exercise_name
-            WHERE (
-                e.primary_muscle_group = ? 
-                OR e.secondary_muscle_group = ?
-                OR e.tertiary_muscle_group = ?
-                OR EXISTS (
-                    SELECT 1
-                    FROM exercise_isolated_muscles m
-                    WHERE m.exercise_name = e.exercise_name
-                      AND m.muscle = ?
-                )
-            )
-            AND scored_weight IS NOT NULL
-            AND scored_max_reps IS NOT NULL
-            AND planned_sets IS NOT NULL
-            """
-            result = db.fetch_one(query, (muscle_group, muscle_group, muscle_group, muscle_group))
-            return result['total_volume'] if result and result['total_volume'] else 0
-    except Exception as e:
-        print(f"Error calculating volume: {e}")
-        return 0
+    stats = calculate_volume_and_frequency_bulk(db).get(muscle_group)
+    return stats['total_volume'] if stats else 0
 
-def calculate_frequency_for_category(category, muscle_group):
+def calculate_frequency_for_category(category, muscle_group, db=None):
     """Calculate training frequency for a muscle group category."""
-    try:
-        with DatabaseHandler() as db:
-            query = """
-            SELECT COUNT(DISTINCT date(created_at)) as frequency
-            FROM workout_log wl
-            JOIN exercises e ON wl.exercise = e.exercise_name
-            WHERE (
-                e.primary_muscle_group = ? 
-                OR e.secondary_muscle_group = ?
-                OR e.tertiary_muscle_group = ?
-                OR EXISTS (
-                    SELECT 1
-                    FROM exercise_isolated_muscles m
-                    WHERE m.exercise_name = e.exercise_name
-                      AND m.muscle = ?
-                )
-            )
-            AND created_at >= date('now', '-7 days')
-            """
-            result = db.fetch_one(query, (muscle_group, muscle_group, muscle_group, muscle_group))
-            return result['frequency'] if result and result['frequency'] else 0
-    except Exception as e:
-        print(f"Error calculating frequency: {e}")
-        return 0
+    stats = calculate_volume_and_frequency_bulk(db).get(muscle_group)
+    return stats['frequency'] if stats else 0
 
 # Test route to verify blueprint is working
 # Test route removed - no longer needed
@@ -309,171 +515,55 @@ def export_to_excel():
         sheets_data = {}
         
         with DatabaseHandler() as db:
+            # Full-table reads and sorts: in-memory temp b-trees, larger cache, mmap
+            configure_bulk_connection(db.connection)
+            
             # Export User Selection (Workout Plan)
             logger.info("Fetching workout plan data")
             
-            # Check if exercise_order column exists and initialize if needed
-            from routes.workout_plan import column_exists
+            # exercise_order is the only optional user_selection column
+            from routes.workout_plan import table_columns
+            has_order = 'exercise_order' in table_columns(db, 'user_selection')
             
             # Initialize/Recalculate exercise_order if column exists
-            if column_exists(db, 'user_selection', 'exercise_order'):
-                # Check current state of exercise_order
-                total_check = db.fetch_one("SELECT COUNT(*) as count FROM user_selection")
-                order_check = db.fetch_one("SELECT COUNT(DISTINCT exercise_order) as distinct_count, COUNT(*) as total_count FROM user_selection WHERE exercise_order IS NOT NULL")
+            if has_order:
+                # Check current state of exercise_order in a single pass
+                order_check = db.fetch_one(
+                    "SELECT COUNT(*) AS total_count, COUNT(exercise_order) AS non_null_count, "
+                    "COUNT(DISTINCT exercise_order) AS distinct_count FROM user_selection"
+                )
                 
                 # Recalculate if all values are the same (like all "1") or NULL
                 needs_recalc = False
-                if total_check and total_check['count'] > 0:
-                    if order_check and order_check['distinct_count'] == 1:
+                if order_check and order_check['total_count'] > 0:
+                    if order_check['distinct_count'] == 1:
                         # All non-NULL values are the same - need to recalculate
                         logger.info(f"All exercise_order values are the same ({order_check['distinct_count']} distinct). Recalculating...")
                         needs_recalc = True
-                    elif order_check and order_check['total_count'] < total_check['count']:
+                    elif order_check['non_null_count'] < order_check['total_count']:
                         # Some values are NULL
                         logger.info(f"Some exercise_order values are NULL. Initializing...")
                         needs_recalc = True
                 
                 if needs_recalc:
-                    logger.info(f"Recalculating exercise_order for {total_check['count']} rows")
-                    
-                    # Get all rows ordered by routine and exercise (don't use existing exercise_order)
-                    ordered_rows = db.fetch_all("""
-                        SELECT id FROM user_selection 
-                        ORDER BY routine, exercise, id
-                    """)
-                    
-                    logger.info(f"Found {len(ordered_rows)} rows to update")
-                    
-                    # Update each row with its sequential order
-                    updated_count = 0
-                    for index, row in enumerate(ordered_rows, start=1):
-                        try:
-                            db.execute_query(
-                                "UPDATE user_selection SET exercise_order = ? WHERE id = ?",
-                                (index, row['id'])
-                            )
-                            updated_count += 1
-                            if index <= 3:  # Log first 3 for debugging
-                                logger.debug(f"Updated row id={row['id']} to exercise_order={index}")
-                        except Exception as e:
-                            logger.error(f"Error updating row id={row['id']}: {e}")
+                    logger.info(f"Recalculating exercise_order for {order_check['total_count']} rows")
                     
-                    # Verify the updates
-                    verify = db.fetch_one("SELECT COUNT(DISTINCT exercise_order) as distinct_count FROM user_selection WHERE exercise_order IS NOT NULL")
-                    logger.info(f"exercise_order recalculated: {updated_count} rows updated, {verify['distinct_count'] if verify else 0} distinct values")
-            
-            # Check if superset_group column exists
-            has_superset = column_exists(db, 'user_selection', 'superset_group')
-            has_order = column_exists(db, 'user_selection', 'exercise_order')
+                    # Number every row in one statement; a single UPDATE is atomic
+                    # and commits once instead of once per row.
+                    updated_count = db.execute_query(EXERCISE_ORDER_RECALC_QUERY)
+                    logger.info(f"exercise_order recalculated: {updated_count} rows updated")
             
             # Build query to fetch all needed columns from exercises table for proper export
             # Order by routine first, then group superset exercises together, then by exercise_order
-            if has_superset and has_order:
-                # For superset exercises: group them together by using a subquery to find 
-                # the minimum exercise_order within each superset group
-                # This ensures superset exercises appear consecutively at their first member's position
-                user_selection_query = """
-                    WITH superset_min_order AS (
-                        SELECT superset_group, routine, MIN(exercise_order) as min_order
-                        FROM user_selection
-                        WHERE superset_group IS NOT NULL
-                        GROUP BY superset_group, routine
-                    )
-                    SELECT 
-                        us.routine,
-                        us.exercise,
-                        e.primary_muscle_group,
-                        e.secondary_muscle_group,
-                        e.tertiary_muscle_group,
-                        e.advanced_isolated_muscles,
-                        e.utility,
-                        e.movement_pattern,
-                        e.movement_subpattern,
-                        us.sets,
-                        us.min_rep_range,
-                        us.max_rep_range,
-                        us.rir,
-                        us.rpe,
-                        us.weight,
-                        us.execution_style,
-                        e.grips,
-                        e.stabilizers,
-                        e.synergists,
-                        us.superset_group,
-                        us.exercise_order,
-                        CASE 
-                            WHEN us.superset_group IS NOT NULL THEN smo.min_order
-                            ELSE us.exercise_order
-                        END as sort_order
-                    FROM user_selection us
-                    LEFT JOIN exercises e ON us.exercise = e.exercise_name
-                    LEFT JOIN superset_min_order smo 
-                        ON us.superset_group = smo.superset_group 
-                        AND us.routine = smo.routine
-                    ORDER BY us.routine, 
-                             sort_order,
-                             CASE WHEN us.superset_group IS NOT NULL THEN 0 ELSE 1 END,
-                             us.superset_group,
-                             us.exercise_order,
-                             us.exercise
-                """
-            elif has_order:
-                user_selection_query = """
-                    SELECT 
-                        us.routine,
-                        us.exercise,
-                        e.primary_muscle_group,
-                        e.secondary_muscle_group,
-                        e.tertiary_muscle_group,
-                        e.advanced_isolated_muscles,
-                        e.utility,
-                        e.movement_pattern,
-                        e.movement_subpattern,
-                        us.sets,
-                        us.min_rep_range,
-                        us.max_rep_range,
-                        us.rir,
-                        us.rpe,
-                        us.weight,
-                        us.execution_style,
-                        e.grips,
-                        e.stabilizers,
-                        e.synergists,
-                        us.superset_group,
-                        us.exercise_order
-                    FROM user_selection us
-                    LEFT JOIN exercises e ON us.exercise = e.exercise_name
-                    ORDER BY us.routine, us.exercise_order, us.exercise
-                """
-            else:
-                user_selection_query = """
-                    SELECT 
-                        us.routine,
-                        us.exercise,
-                        e.primary_muscle_group,
-                        e.secondary_muscle_group,
-                        e.tertiary_muscle_group,
-                        e.advanced_isolated_muscles,
-                        e.utility,
-                        e.movement_pattern,
-                        e.movement_subpattern,
-                        us.sets,
-                        us.min_rep_range,
-                        us.max_rep_range,
-                        us.rir,
-                        us.rpe,
-                        us.weight,
-                        us.execution_style,
-                        e.grips,
-                        e.stabilizers,
-                        e.synergists,
-                        us.superset_group
-                    FROM user_selection us
-                    LEFT JOIN exercises e ON us.exercise = e.exercise_name
-                    ORDER BY us.routine, us.exercise
-                """
+            user_selection_query = (
+                WORKOUT_PLAN_ORDERED_QUERY if has_order else WORKOUT_PLAN_BASIC_QUERY
+            )
             
-            user_selection = db.fetch_all(user_selection_query)
+            # sqlite3.Row objects are re-keyed by reorder_and_rename_columns
+            # directly, so skip fetch_all's intermediate dict per row
+            user_selection = db.connection.execute(user_selection_query).fetchall()
+            if has_order:
+                user_selection = order_plan_supersets(user_selection)
             if user_selection:
                 # Reorder and rename columns based on view mode
                 user_selection = reorder_and_rename_columns(
@@ -486,124 +576,66 @@ def export_to_excel():
 
             # Export Workout Log
             logger.info("Fetching workout log data")
-            workout_log_query = f"""
-            SELECT * FROM workout_log 
-            ORDER BY created_at DESC
-            LIMIT {MAX_EXPORT_ROWS}
-            """
-            workout_log = db.fetch_all(workout_log_query)
-            if workout_log:
-                sheets_data['Workout Log'] = workout_log
-                logger.info(f"Fetched {len(workout_log)} workout log rows")
+            # Large sheets are streamed from the cursor while the workbook is written
+            sheets_data['Workout Log'] = db.connection.execute(WORKOUT_LOG_EXPORT_QUERY, (MAX_EXPORT_ROWS,))
 
             # Export Weekly Summary
             logger.info("Calculating weekly summary")
-            weekly_summary = calculate_weekly_summary('Total')
+            weekly_summary = calculate_weekly_summary('Total', db=db)
             if weekly_summary:
                 sheets_data['Weekly Summary'] = weekly_summary
                 logger.info(f"Generated {len(weekly_summary)} weekly summary rows")
 
             # Export Session Summary with exercise categories
             logger.info("Fetching session summary data")
-            session_summary_query = f"""
-            SELECT 
-                date(wl.created_at) as session_date,
-                wl.routine,
-                wl.exercise,
-                e.primary_muscle_group,
-                e.secondary_muscle_group,
-                e.tertiary_muscle_group,
-                e.advanced_isolated_muscles,
-                wl.planned_sets,
-                wl.planned_min_reps,
-                wl.planned_max_reps,
-                wl.planned_weight,
-                wl.planned_rir,
-                wl.planned_rpe,
-                wl.scored_weight,
-                wl.scored_max_reps,
-                wl.scored_rir,
-                wl.scored_rpe
-            FROM workout_log wl
-            LEFT JOIN exercises e ON wl.exercise = e.exercise_name
-            WHERE (
-                wl.scored_weight IS NOT NULL
-                OR wl.scored_max_reps IS NOT NULL
-                OR wl.planned_weight IS NOT NULL
-                OR wl.planned_sets IS NOT NULL
-            )
-            AND wl.routine IS NOT NULL
-            ORDER BY wl.created_at DESC
-            LIMIT {MAX_EXPORT_ROWS}
-            """
-            session_summary = db.fetch_all(session_summary_query)
-            if session_summary:
-                sheets_data['Session Summary'] = session_summary
-                logger.info(f"Fetched {len(session_summary)} session summary rows")
+            sheets_data['Session Summary'] = db.connection.execute(SESSION_SUMMARY_EXPORT_QUERY, (MAX_EXPORT_ROWS,))
 
             # Export Progression Goals
             logger.info("Fetching progression goals")
-            progression_query = """
-            SELECT 
-                exercise,
-                goal_type,
-                current_value,
-                target_value,
-                goal_date,
-                completed,
-                created_at
-            FROM progression_goals
-            ORDER BY created_at DESC
-            """
-            progression_goals = db.fetch_all(progression_query)
+            progression_goals = db.fetch_all(PROGRESSION_GOALS_EXPORT_QUERY)
             if progression_goals:
                 sheets_data['Progression Goals'] = progression_goals
                 logger.info(f"Fetched {len(progression_goals)} progression goals")
 
             # Export Categories Summary
             logger.info("Calculating exercise categories")
-            categories = calculate_exercise_categories()
+            categories = calculate_exercise_categories(db)
             if categories:
                 sheets_data['Categories'] = categories
                 logger.info(f"Generated {len(categories)} category rows")
 
             # Export Isolated Muscles Stats
             logger.info("Calculating isolated muscles stats")
-            isolated_muscles = calculate_isolated_muscles_stats()
+            isolated_muscles = calculate_isolated_muscles_stats(db)
             if isolated_muscles:
                 sheets_data['Isolated Muscles'] = isolated_muscles
                 logger.info(f"Generated {len(isolated_muscles)} isolated muscle rows")
 
-        # Generate filename with timestamp
-        filename = generate_timestamped_filename('workout_tracker_summary')
-        
-        logger.info(f"Creating Excel workbook with {len(sheets_data)} sheets: {list(sheets_data.keys())}")
-        
-        try:
-            response = create_excel_workbook(sheets_data, filename)
-            
-            # Ensure response has data
-            if hasattr(response, 'data') and (not response.data or len(response.data) == 0):
-                logger.error("Response data is empty!")
-                raise ValueError("Generated Excel file is empty")
+            # Generate filename with timestamp
+            filename = generate_timestamped_filename('workout_tracker_summary')
             
-            # Calculate total rows across all sheets
-            total_rows = sum(len(data) for data in sheets_data.values())
+            logger.info(f"Creating Excel workbook with {len(sheets_data)} sheets: {list(sheets_data.keys())}")
             
-            logger.info(
-                "Excel export completed successfully",
-                extra={
-                    'export_type': 'excel',
-                    'export_filename': filename,
-                    'sheet_count': len(sheets_data),
-                    'total_rows': total_rows,
-                    'sheets': list(sheets_data.keys())
-                }
-            )
-            return response
-        except Exception as create_error:
-            logger.exception(f"Error in create_excel_workbook: {create_error}")
-            raise
+            # Build the workbook while the connection is open so cursor-backed
+            # sheets can be streamed straight into it
+            try:
+                # create_excel_workbook rejects empty files before building the
+                # streamed response, so its body is not read back here
+                response = create_excel_workbook(sheets_data, filename)
+                
+                logger.info(
+                    "Excel export completed successfully",
+                    extra={
+                        'export_type': 'excel',
+                        'export_filename': filename,
+                        'sheet_count': len(sheets_data),
+                        'sheets': list(sheets_data.keys())
+                    }
+                )
+                return response
+            except Exception as create_error:
+                logger.exception(f"Error in create_excel_workbook: {create_error}")
+                raise
         
     except Exception as e:
         logger.exception(f"Error exporting to Excel: {e}")
@@ -624,23 +656,10 @@ def export_to_workout_log():
     try:
         logger.info("Starting workout plan export to workout log")
         
-        query = """
-        SELECT id, routine, exercise, sets, min_rep_range, max_rep_range, 
-               rir, rpe, weight
-        FROM user_selection
-        """
-        
-        insert_query = """
-        INSERT INTO workout_log (
-            workout_plan_id, routine, exercise, planned_sets, planned_min_reps,
-            planned_max_reps, planned_rir, planned_rpe, planned_weight, created_at
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-        """
-        
         with DatabaseHandler() as db:
-            workout_plan = db.fetch_all(query)
+            exported_count = db.execute_query(WORKOUT_PLAN_TO_LOG_QUERY)
             
-            if not workout_plan:
+            if not exported_count:
                 logger.warning("No exercises found in workout plan to export")
                 return error_response(
                     "NO_DATA",
@@ -648,16 +667,6 @@ def export_to_workout_log():
                     400
                 )
             
-            exported_count = 0
-            for exercise in workout_plan:
-                params = (
-                    exercise["id"], exercise["routine"], exercise["exercise"],
-                    exercise["sets"], exercise["min_rep_range"], exercise["max_rep_range"],
-                    exercise["rir"], exercise["rpe"], exercise["weight"]
-                )
-                db.execute_query(insert_query, params)
-                exported_count += 1
-            
             logger.info(f"Successfully exported {exported_count} exercises to workout log")
         
         return success_response(
@@ -686,19 +695,20 @@ def export_summary():
         logger.info(f"Starting summary export with method: {method}")
         sheets_data = {}
         
-        # Export Weekly Summary
-        logger.info("Calculating weekly summary")
-        weekly_data = calculate_weekly_summary(method)
-        if weekly_data:
-            sheets_data['Weekly Summary'] = weekly_data
-            logger.info(f"Generated {len(weekly_data)} weekly summary rows")
-        
-        # Export Categories
-        logger.info("Calculating exercise categories")
-        categories = calculate_exercise_categories()
-        if categories:
-            sheets_data['Categories'] = categories
-            logger.info(f"Generated {len(categories)} category rows")
+        with DatabaseHandler() as db:
+            # Export Weekly Summary
+            logger.info("Calculating weekly summary")
+            weekly_data = calculate_weekly_summary(method, db=db)
+            if weekly_data:
+                sheets_data['Weekly Summary'] = weekly_data
+                logger.info(f"Generated {len(weekly_data)} weekly summary rows")
+            
+            # Export Categories
+            logger.info("Calculating exercise categories")
+            categories = calculate_exercise_categories(db)
+            if categories:
+                sheets_data['Categories'] = categories
+                logger.info(f"Generated {len(categories)} category rows")
         
         if not sheets_data:
             logger.warning("No data available for export; returning empty workbook")
@@ -739,53 +749,26 @@ def export_large_dataset():
         def data_generator():
             """Generator that yields (sheet_name, data) tuples for streaming."""
             with DatabaseHandler() as db:
+                configure_bulk_connection(db.connection)
+                
+                # Log sheets are handed over as live cursors, so rows go from
+                # SQLite to the worksheet one at a time
                 if export_type in ['all', 'workout_log']:
-                    # Stream workout log in batches
                     logger.info("Streaming workout log data")
-                    query = f"""
-                    SELECT * FROM workout_log 
-                    ORDER BY created_at DESC
-                    LIMIT {MAX_EXPORT_ROWS}
-                    """
-                    workout_log = db.fetch_all(query)
-                    if workout_log:
-                        yield ('Workout Log', workout_log)
+                    yield ('Workout Log', db.connection.execute(WORKOUT_LOG_EXPORT_QUERY, (MAX_EXPORT_ROWS,)))
                 
                 if export_type in ['all', 'session_summary']:
-                    # Stream session summary
                     logger.info("Streaming session summary data")
-                    query = f"""
-                    SELECT 
-                        date(wl.created_at) as session_date,
-                        wl.routine,
-                        wl.exercise,
-                        e.primary_muscle_group,
-                        e.secondary_muscle_group,
-                        wl.planned_sets,
-                        wl.planned_min_reps,
-                        wl.planned_max_reps,
-                        wl.planned_weight,
-                        wl.scored_weight,
-                        wl.scored_max_reps
-                    FROM workout_log wl
-                    LEFT JOIN exercises e ON wl.exercise = e.exercise_name
-                    WHERE wl.scored_weight IS NOT NULL
-                       OR wl.scored_max_reps IS NOT NULL
-                    ORDER BY wl.created_at DESC
-                    LIMIT {MAX_EXPORT_ROWS}
-                    """
-                    session_data = db.fetch_all(query)
-                    if session_data:
-                        yield ('Session Summary', session_data)
+                    yield ('Session Summary', db.connection.execute(STREAMED_SESSION_SUMMARY_QUERY, (MAX_EXPORT_ROWS,)))
                 
                 if export_type == 'all':
                     # Add summary sheets
                     logger.info("Generating summary sheets")
-                    weekly = calculate_weekly_summary('Total')
+                    weekly = calculate_weekly_summary('Total', db=db)
                     if weekly:
                         yield ('Weekly Summary', weekly)
                     
-                    categories = calculate_exercise_categories()
+                    categories = calculate_exercise_categories(db)
                     if categories:
                         yield ('Categories', categories)
         
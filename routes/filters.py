@@ -1,5 +1,8 @@
-from flask import Blueprint, jsonify, request
+import json
+
+from flask import Blueprint, current_app, jsonify, request
 from utils.filter_predicates import FilterPredicates
+from utils.filter_cache import get_or_compute
 from utils.database import DatabaseHandler
 from utils.errors import success_response, error_response
 from utils.logger import get_logger
@@ -75,6 +78,21 @@ for simple_key, advanced_keys in SIMPLE_TO_ADVANCED_ISOLATED.items():
     for adv_key in advanced_keys:
         ADVANCED_TO_SIMPLE_MUSCLE[adv_key] = simple_key
 
+# (is advanced_isolated_muscles field, filter value) → (db values, is_mapped_key),
+# resolved once here so expand_simple_muscle_value is a single lookup.
+# Simple keys are written last so they win over an identical advanced key.
+MUSCLE_EXPANSIONS = {}
+for adv_key, simple_key in ADVANCED_TO_SIMPLE_MUSCLE.items():
+    MUSCLE_EXPANSIONS[(True, adv_key)] = ((adv_key,), True)
+    MUSCLE_EXPANSIONS[(False, adv_key)] = (
+        tuple(SIMPLE_TO_DB_MUSCLE.get(simple_key, [adv_key])), True
+    )
+for simple_key, db_values in SIMPLE_TO_DB_MUSCLE.items():
+    MUSCLE_EXPANSIONS[(True, simple_key)] = (
+        tuple(SIMPLE_TO_ADVANCED_ISOLATED.get(simple_key, [simple_key])), True
+    )
+    MUSCLE_EXPANSIONS[(False, simple_key)] = (tuple(db_values), True)
+
 # Define standard filter mapping - supports both display names and snake_case keys
 FILTER_MAPPING = {
     # Display names (from data-filter-key attribute)
@@ -139,14 +157,26 @@ ALLOWED_COLUMNS = {
 }
 
 
+# Lowercased whitelist keys, built once so validation is a single set probe
+_ALLOWED_TABLE_KEYS = frozenset(k.lower() for k in ALLOWED_TABLES)
+_ALLOWED_COLUMN_KEYS = frozenset(k.lower() for k in ALLOWED_COLUMNS)
+
+
 def validate_table_name(table: str) -> bool:
     """Validate that table name is in whitelist."""
-    return table.lower() in {k.lower(): v for k, v in ALLOWED_TABLES.items()}
+    return table.lower() in _ALLOWED_TABLE_KEYS
+
+
+# Enumerated columns are matched exactly (case-insensitive), as FilterPredicates
+# does; every other column keeps substring LIKE matching
+EXACT_MATCH_COLUMNS = frozenset(
+    FilterPredicates.VALID_FILTER_FIELDS - FilterPredicates.PARTIAL_MATCH_FIELDS
+)
 
 
 def validate_column_name(column: str) -> bool:
     """Validate that column name is in whitelist."""
-    return column.lower() in {k.lower(): v for k, v in ALLOWED_COLUMNS.items()}
+    return column.lower() in _ALLOWED_COLUMN_KEYS
 
 
 ENUM_VALUE_MAP = {
@@ -164,29 +194,13 @@ def expand_simple_muscle_value(field: str, value: str) -> tuple:
         value: The filter value (could be simple key, advanced key, or direct DB value)
         
     Returns:
-        Tuple of (expanded_values: list, is_mapped_key: bool)
+        Tuple of (expanded_values: tuple, is_mapped_key: bool)
     """
-    # Check if this is a simple key
-    if value in SIMPLE_TO_DB_MUSCLE:
-        if field == 'advanced_isolated_muscles':
-            # For isolated muscles, use the advanced mapping
-            return SIMPLE_TO_ADVANCED_ISOLATED.get(value, [value]), True
-        else:
-            # For primary/secondary/tertiary, use the DB mapping
-            return SIMPLE_TO_DB_MUSCLE.get(value, [value]), True
-    
-    # Check if this is an advanced/scientific key
-    if value in ADVANCED_TO_SIMPLE_MUSCLE:
-        if field == 'advanced_isolated_muscles':
-            # For isolated muscles, the advanced key is the DB value
-            return [value], True
-        else:
-            # For primary/secondary/tertiary, map advanced → simple → DB
-            simple_key = ADVANCED_TO_SIMPLE_MUSCLE[value]
-            return SIMPLE_TO_DB_MUSCLE.get(simple_key, [value]), True
-    
+    expansion = MUSCLE_EXPANSIONS.get((field == 'advanced_isolated_muscles', value))
+    if expansion is not None:
+        return expansion
     # Not a mapped key - return as-is
-    return [value], False
+    return (value,), False
 
 
 @filters_bp.route("/filter_exercises", methods=["POST"])
@@ -197,7 +211,7 @@ def filter_exercises():
         if not filters:
             return error_response("VALIDATION_ERROR", "No filters provided", 400)
 
-        logger.debug(f"Received filters: {filters}")
+        logger.debug("Received filters: %s", filters)
 
         # Convert frontend names to database column names and expand simple values
         sanitized_filters = {}
@@ -208,7 +222,7 @@ def filter_exercises():
             
             #  NEW CODE VERIFICATION: Check if field is in mapping
             if db_field is None:
-                logger.warning(f"New code guard: unknown filter field rejected: {key}")
+                logger.warning("New code guard: unknown filter field rejected: %s", key)
                 return error_response("VALIDATION_ERROR", f"Invalid filter column: {key}", 400)
             
             if value:  # Only include non-empty values
@@ -233,20 +247,21 @@ def filter_exercises():
                     else:
                         sanitized_filters[db_field] = value
                 else:
-                    logger.warning(f"Invalid column in filter: {db_field}")
+                    logger.warning("Invalid column in filter: %s", db_field)
                     return error_response("VALIDATION_ERROR", f"Invalid filter column: {key}", 400)
 
-        logger.debug(f"Sanitized filters: {sanitized_filters}")
-        logger.debug(f"Expanded muscle filters: {expanded_muscle_filters}")
+        logger.debug("Sanitized filters: %s", sanitized_filters)
+        logger.debug("Expanded muscle filters: %s", expanded_muscle_filters)
         
-        # Build custom query if we have expanded muscle filters
-        if expanded_muscle_filters:
-            exercise_names = filter_exercises_with_expanded_muscles(
-                sanitized_filters, expanded_muscle_filters
-            )
-        else:
-            # Apply filters and get results
-            exercise_names = FilterPredicates.get_exercises(filters=sanitized_filters)
+        # Identical filter sets share one cached result until the catalogue changes
+        cache_key = "filter:" + json.dumps(
+            [sanitized_filters, expanded_muscle_filters], sort_keys=True
+        )
+        exercise_names = get_or_compute(
+            'exercises',
+            cache_key,
+            lambda: _query_filtered_exercises(sanitized_filters, expanded_muscle_filters),
+        )
         
         logger.info(
             "Exercises filtered",
@@ -266,6 +281,16 @@ def filter_exercises():
         return error_response("INTERNAL_ERROR", "Failed to filter exercises", 500)
 
 
+def _query_filtered_exercises(sanitized_filters: dict, expanded_muscle_filters: dict) -> list:
+    """Run the exercise filter query for already-sanitized filters."""
+    # Build custom query if we have expanded muscle filters
+    if expanded_muscle_filters:
+        return filter_exercises_with_expanded_muscles(
+            sanitized_filters, expanded_muscle_filters
+        )
+    return FilterPredicates.get_exercises(filters=sanitized_filters)
+
+
 def filter_exercises_with_expanded_muscles(
     single_filters: dict, 
     multi_value_filters: dict
@@ -280,53 +305,39 @@ def filter_exercises_with_expanded_muscles(
     Returns:
         List of matching exercise names
     """
-    query = "SELECT exercise_name FROM exercises WHERE 1=1"
+    # Fields are visited in sorted order so the same filter set always yields
+    # the same SQL text and reuses the connection's cached statement
+    conditions = []
     params = []
     
     # Add single filters (AND logic)
-    for field, value in single_filters.items():
+    for field, value in sorted(single_filters.items()):
         if field == 'advanced_isolated_muscles':
-            query += """
-                AND EXISTS (
-                    SELECT 1 FROM exercise_isolated_muscles m
-                    WHERE m.exercise_name = exercises.exercise_name
-                    AND m.muscle LIKE ?
-                )
-            """
+            conditions.append(FilterPredicates.isolated_muscle_condition())
             params.append(f"%{value}%")
         elif field in ('primary_muscle_group', 'secondary_muscle_group', 'tertiary_muscle_group'):
-            query += f" AND {field} LIKE ?"
+            conditions.append(f"{field} LIKE ?")
             params.append(f"%{value}%")
         else:
-            query += f" AND LOWER({field}) = LOWER(?)"
+            conditions.append(f"{field} = ? COLLATE NOCASE")
             params.append(value)
     
     # Add multi-value muscle filters (OR within each field)
-    for field, values in multi_value_filters.items():
+    for field, values in sorted(multi_value_filters.items()):
         if not values:
             continue
             
         if field == 'advanced_isolated_muscles':
-            # Build OR conditions for isolated muscles
-            or_conditions = []
-            for val in values:
-                or_conditions.append("""
-                    EXISTS (
-                        SELECT 1 FROM exercise_isolated_muscles m
-                        WHERE m.exercise_name = exercises.exercise_name
-                        AND m.muscle LIKE ?
-                    )
-                """)
-                params.append(f"%{val}%")
-            query += f" AND ({' OR '.join(or_conditions)})"
+            # One mapping-table lookup with the values OR'd inside it
+            conditions.append(FilterPredicates.isolated_muscle_condition(len(values)))
         else:
-            # Build OR conditions for muscle group columns
-            or_conditions = []
-            for val in values:
-                or_conditions.append(f"{field} LIKE ?")
-                params.append(f"%{val}%")
-            query += f" AND ({' OR '.join(or_conditions)})"
+            # OR conditions for muscle group columns
+            conditions.append("(" + " OR ".join([f"{field} LIKE ?"] * len(values)) + ")")
+        params.extend(f"%{val}%" for val in values)
     
+    query = "SELECT exercise_name FROM exercises WHERE 1=1"
+    if conditions:
+        query += " AND " + " AND ".join(conditions)
     query += " ORDER BY exercise_name ASC"
     
     try:
@@ -353,17 +364,109 @@ def get_all_exercises():
         logger.exception("Error in get_all_exercises")
         return error_response("INTERNAL_ERROR", "Failed to fetch exercises", 500) 
 
+def _query_unique_values(safe_table: str, safe_column: str) -> list:
+    """Read the distinct values of a whitelisted table/column pair."""
+    with DatabaseHandler() as db:
+        if safe_table == 'exercises' and safe_column == 'advanced_isolated_muscles':
+            records = db.fetch_all(
+                "SELECT DISTINCT muscle FROM exercise_isolated_muscles ORDER BY muscle"
+            )
+            return [row['muscle'] for row in records]
+
+        # Force column: query DB and normalize to title case to merge variants
+        if safe_column == 'force':
+            query = (
+                f"SELECT DISTINCT {safe_column} AS value FROM {safe_table} "
+                f"WHERE {safe_column} IS NOT NULL AND TRIM({safe_column}) <> '' "
+                f"ORDER BY {safe_column}"
+            )
+            rows = db.fetch_all(query)
+            # Normalize to title case and dedupe (merges 'push'/'Push', 'pull'/'Pull')
+            seen = set()
+            values = []
+            for row in rows:
+                val = row['value']
+                if val:
+                    normalized = val.strip().title()
+                    if normalized not in seen:
+                        seen.add(normalized)
+                        values.append(normalized)
+            return sorted(values)
+
+        if safe_column in {
+            'primary_muscle_group',
+            'secondary_muscle_group',
+            'tertiary_muscle_group',
+        }:
+            query = (
+                f"SELECT DISTINCT {safe_column} AS value FROM {safe_table} "
+                f"WHERE {safe_column} IS NOT NULL AND TRIM({safe_column}) <> '' "
+                f"ORDER BY {safe_column}"
+            )
+            return [row['value'] for row in db.fetch_all(query)]
+
+        if safe_column == 'equipment':
+            query = (
+                f"SELECT DISTINCT TRIM({safe_column}) AS value FROM {safe_table} "
+                f"WHERE {safe_column} IS NOT NULL AND TRIM({safe_column}) <> '' "
+                f"ORDER BY value"
+            )
+            return [row['value'] for row in db.fetch_all(query) if row.get('value')]
+
+        query = (
+            f"SELECT DISTINCT {safe_column} AS value FROM {safe_table} "
+            f"WHERE {safe_column} IS NOT NULL AND TRIM({safe_column}) <> '' "
+            f"ORDER BY {safe_column}"
+        )
+        return [row['value'] for row in db.fetch_all(query) if row.get('value')]
+
+
+# Catalogue columns whose dropdown payloads are built at startup
+CATALOGUE_VALUE_COLUMNS = (
+    'primary_muscle_group',
+    'secondary_muscle_group',
+    'tertiary_muscle_group',
+    'advanced_isolated_muscles',
+    'force',
+    'equipment',
+)
+
+
+def _cached_catalogue_values(safe_column: str) -> bytes:
+    """Return the serialized success payload for an exercises column, from cache when warm.
+
+    An empty column is served but not cached, so it is re-queried next time.
+    """
+    def _compute():
+        values = _query_unique_values('exercises', safe_column)
+        return jsonify(success_response(data=values)).get_data() if values else None
+
+    body = get_or_compute('exercises', f"values:{safe_column}", _compute)
+    if body is None:
+        body = jsonify(success_response(data=[])).get_data()
+    return body
+
+
+def warm_unique_values() -> None:
+    """Build the dropdown payloads of CATALOGUE_VALUE_COLUMNS. Needs an app context."""
+    for column in CATALOGUE_VALUE_COLUMNS:
+        try:
+            _cached_catalogue_values(column)
+        except Exception:
+            logger.warning("Failed to warm unique values for exercises.%s", column, exc_info=True)
+
+
 @filters_bp.route("/get_unique_values/<table>/<column>")
 def get_unique_values(table, column):
     """Get unique values for a given column in a table."""
     try:
         # Validate table and column names against whitelist
         if not validate_table_name(table):
-            logger.warning(f"Invalid table name: {table}")
+            logger.warning("Invalid table name: %s", table)
             return error_response("VALIDATION_ERROR", f"Invalid table: {table}", 400)
         
         if not validate_column_name(column):
-            logger.warning(f"Invalid column name: {column}")
+            logger.warning("Invalid column name: %s", column)
             return error_response("VALIDATION_ERROR", f"Invalid column: {column}", 400)
         
         # Get safe table and column names from whitelist
@@ -373,72 +476,17 @@ def get_unique_values(table, column):
         if not safe_table or not safe_column:
             return error_response("VALIDATION_ERROR", "Invalid table or column", 400)
         
-        # Use parameterized query with safe names
-        with DatabaseHandler() as db:
-            if safe_table == 'exercises' and safe_column == 'advanced_isolated_muscles':
-                records = db.fetch_all(
-                    "SELECT DISTINCT muscle FROM exercise_isolated_muscles ORDER BY muscle"
-                )
-                values = [row['muscle'] for row in records]
-                return jsonify(success_response(data=values))
-
-            if safe_column in ENUM_VALUE_MAP:
-                return jsonify(success_response(data=ENUM_VALUE_MAP[safe_column]))
-
-            # Force column: query DB and normalize to title case to merge variants
-            if safe_column == 'force':
-                query = (
-                    f"SELECT DISTINCT {safe_column} AS value FROM {safe_table} "
-                    f"WHERE {safe_column} IS NOT NULL AND TRIM({safe_column}) <> '' "
-                    f"ORDER BY {safe_column}"
-                )
-                rows = db.fetch_all(query)
-                # Normalize to title case and dedupe (merges 'push'/'Push', 'pull'/'Pull')
-                seen = set()
-                values = []
-                for row in rows:
-                    val = row['value']
-                    if val:
-                        normalized = val.strip().title()
-                        if normalized not in seen:
-                            seen.add(normalized)
-                            values.append(normalized)
-                return jsonify(success_response(data=sorted(values)))
-
-            if safe_column in {
-                'primary_muscle_group',
-                'secondary_muscle_group',
-                'tertiary_muscle_group',
-            }:
-                query = (
-                    f"SELECT DISTINCT {safe_column} AS value FROM {safe_table} "
-                    f"WHERE {safe_column} IS NOT NULL AND TRIM({safe_column}) <> '' "
-                    f"ORDER BY {safe_column}"
-                )
-                rows = db.fetch_all(query)
-                values = [row['value'] for row in rows]
-                return jsonify(success_response(data=values))
-
-            if safe_column == 'equipment':
-                query = (
-                    f"SELECT DISTINCT TRIM({safe_column}) AS value FROM {safe_table} "
-                    f"WHERE {safe_column} IS NOT NULL AND TRIM({safe_column}) <> '' "
-                    f"ORDER BY value"
-                )
-                rows = db.fetch_all(query)
-                values = [row['value'] for row in rows if row.get('value')]
-                return jsonify(success_response(data=values))
+        if safe_column in ENUM_VALUE_MAP:
+            return jsonify(success_response(data=ENUM_VALUE_MAP[safe_column]))
 
-            query = (
-                f"SELECT DISTINCT {safe_column} AS value FROM {safe_table} "
-                f"WHERE {safe_column} IS NOT NULL AND TRIM({safe_column}) <> '' "
-                f"ORDER BY {safe_column}"
-            )
-            results = db.fetch_all(query)
-            values = [row['value'] for row in results if row.get('value')]
-            return jsonify(success_response(data=values))
+        # Only the catalogue dropdown columns are cached; plan and log tables change per request
+        if safe_table == 'exercises' and safe_column in CATALOGUE_VALUE_COLUMNS:
+            body = _cached_catalogue_values(safe_column)
+            return current_app.response_class(body, mimetype='application/json')
+        values = _query_unique_values(safe_table, safe_column)
+        return jsonify(success_response(data=values))
     except Exception as e:
-        logger.exception(f"Error fetching unique values for {table}.{column}")
+        logger.exception("Error fetching unique values for %s.%s", table, column)
         return error_response("INTERNAL_ERROR", "Failed to fetch unique values", 500) 
 
 @filters_bp.route("/get_filtered_exercises", methods=["POST"])
@@ -454,31 +502,35 @@ def get_filtered_exercises():
         FROM exercises
         WHERE 1=1
         """
-        params = []
+        # Cheap equality checks on enumerated columns go ahead of the
+        # substring LIKE scans so rows are rejected before any pattern match
+        exact_conditions, exact_params = [], []
+        like_conditions, like_params = [], []
         
-        for field, value in filters.items():
+        for field, value in sorted(filters.items()):
             # Validate column name is whitelisted
             if not validate_column_name(field):
-                logger.warning(f"Invalid column in filter: {field}")
+                logger.warning("Invalid column in filter: %s", field)
                 return error_response("VALIDATION_ERROR", f"Invalid filter column: {field}", 400)
             
             if value:
                 safe_column = ALLOWED_COLUMNS.get(field.lower())
                 # Special handling for advanced_isolated_muscles - use mapping table
                 if safe_column == "advanced_isolated_muscles":
-                    query += """
-                        AND EXISTS (
-                            SELECT 1
-                            FROM exercise_isolated_muscles m
-                            WHERE m.exercise_name = exercises.exercise_name
-                              AND m.muscle LIKE ?
-                        )
-                    """
-                    params.append(f"%{value}%")
+                    like_conditions.append(FilterPredicates.isolated_muscle_condition())
+                    like_params.append(f"%{value}%")
+                elif safe_column in EXACT_MATCH_COLUMNS:
+                    exact_conditions.append(f"{safe_column} = ? COLLATE NOCASE")
+                    exact_params.append(value)
                 else:
-                    query += f" AND {safe_column} LIKE ?"
-                    params.append(f"%{value}%")
-                
+                    like_conditions.append(f"{safe_column} LIKE ?")
+                    like_params.append(f"%{value}%")
+        
+        conditions = exact_conditions + like_conditions
+        if conditions:
+            query += " AND " + " AND ".join(conditions)
+        params = exact_params + like_params
+        
         query += " ORDER BY exercise_name ASC"
         
         with DatabaseHandler() as db:
@@ -1,6 +1,6 @@
 from flask import Blueprint, render_template, request, jsonify, Response, send_file
 from utils.database import DatabaseHandler
-from utils.workout_log import get_workout_logs, check_progression
+from utils.workout_log import WORKOUT_LOGS_QUERY, get_workout_logs, check_progression
 from utils.volume_classifier import (
     get_volume_class,
     get_volume_label,
@@ -194,41 +194,54 @@ def get_logs():
 @workout_log_bp.route('/export_workout_log')
 def export_workout_log():
     try:
-        # Lazy load pandas - only imported when export is requested
-        import pandas as pd
+        # Lazy load xlsxwriter - only imported when export is requested
+        from xlsxwriter import Workbook
         
-        # Get workout log data
-        logs = get_workout_logs()
+        try:
+            with DatabaseHandler() as db:
+                cursor = db.connection.cursor()
+                cursor.row_factory = None  # plain tuples, transposed into columns below
+                cursor.execute(WORKOUT_LOGS_QUERY)
+                headers = [column[0] for column in cursor.description]
+                rows = cursor.fetchall()
+                # Reset the statement before the connection goes back to the pool
+                cursor.close()
+        except Exception:
+            # A failed read is reported as nothing to export, as get_workout_logs() does
+            logger.exception("Error reading workout logs for export")
+            rows = []
         
-        if not logs:
+        if not rows:
             return error_response("NOT_FOUND", "No workout logs found to export", 404)
         
-        # Convert to DataFrame
-        df = pd.DataFrame(logs)
+        # Fixed schema, so write whole columns directly instead of via pandas
+        columns = list(zip(*rows))
         
         # Create Excel file in memory
         output = BytesIO()
-        with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
-            df.to_excel(writer, sheet_name='Workout Log', index=False)
-            
-            # Get the workbook and worksheet objects
-            workbook = writer.book
-            worksheet = writer.sheets['Workout Log']
-            
-            # Add some formatting
-            header_format = workbook.add_format({
-                'bold': True,
-                'bg_color': '#f8f9fa',
-                'border': 1
-            })
-            
-            # Format the header row
-            for col_num, value in enumerate(df.columns.values):
-                worksheet.write(0, col_num, value, header_format)
-                
+        workbook = Workbook(output, {'in_memory': True})
+        worksheet = workbook.add_worksheet('Workout Log')
+        
+        # Add some formatting
+        header_format = workbook.add_format({
+            'bold': True,
+            'bg_color': '#f8f9fa',
+            'border': 1
+        })
+        worksheet.write_row(0, 0, headers, header_format)
+        
+        # TIMESTAMP and DATE columns, formatted as pandas' ExcelWriter did
+        column_formats = {
+            'created_at': workbook.add_format({'num_format': 'yyyy-mm-dd hh:mm:ss'}),
+            'last_progression_date': workbook.add_format({'num_format': 'yyyy-mm-dd'}),
+        }
+        
+        for idx, (header, values) in enumerate(zip(headers, columns)):
+            worksheet.write_column(1, idx, values, column_formats.get(header))
             # Adjust column widths
-            for idx, col in enumerate(df.columns):
-                worksheet.set_column(idx, idx, max(len(str(col)), df[col].astype(str).str.len().max()) + 2)
+            worksheet.set_column(idx, idx, max(len(header), max(len(str(value)) for value in values)) + 2)
+        
+        workbook.close()
         
         # Seek to the beginning of the stream
         output.seek(0)
@@ -252,7 +265,19 @@ def export_workout_log():
 def export_to_workout_log():
     try:
         with DatabaseHandler() as db:
+            # Copy the whole plan server-side in one statement
             query = """
+            INSERT INTO workout_log (
+                routine,
+                exercise,
+                planned_sets,
+                planned_min_reps,
+                planned_max_reps,
+                planned_rir,
+                planned_rpe,
+                planned_weight,
+                created_at
+            )
             SELECT 
                 us.routine,
                 us.exercise,
@@ -261,46 +286,17 @@ def export_to_workout_log():
                 us.max_rep_range,
                 us.rir,
                 us.rpe,
-                us.weight
+                us.weight,
+                ?
             FROM user_selection us
             """
-            workout_plans = db.fetch_all(query)
+            exported_count = db.execute_query(
+                query, (datetime.now().strftime('%Y-%m-%d %H:%M:%S'),)
+            )
             
-            if not workout_plans:
+            if not exported_count:
                 return error_response("NOT_FOUND", "No workout plans found to export", 404)
             
-            # Insert each entry into workout_log
-            exported_count = 0
-            for plan in workout_plans:
-                insert_query = """
-                INSERT INTO workout_log (
-                    routine,
-                    exercise,
-                    planned_sets,
-                    planned_min_reps,
-                    planned_max_reps,
-                    planned_rir,
-                    planned_rpe,
-                    planned_weight,
-                    created_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """
-                
-                params = (
-                    plan['routine'],
-                    plan['exercise'],
-                    plan['sets'],
-                    plan['min_rep_range'],
-                    plan['max_rep_range'],
-                    plan['rir'],
-                    plan['rpe'],
-                    plan['weight'],
-                    datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                )
-                
-                db.execute_query(insert_query, params)
-                exported_count += 1
-            
             logger.info(f"Exported {exported_count} exercises to workout log")
             return jsonify(success_response(
                 message=f"Successfully exported {exported_count} exercises to workout log"
@@ -221,10 +221,11 @@ def get_workout_plan():
         
         # First check if exercise_order and superset_group columns exist
         with DatabaseHandler() as db:
-            # Check if columns exist using PRAGMA
-            has_order = column_exists(db, 'user_selection', 'exercise_order')
-            has_superset = column_exists(db, 'user_selection', 'superset_group')
-            has_execution_style = column_exists(db, 'user_selection', 'execution_style')
+            # Check which optional columns exist with one PRAGMA
+            columns = table_columns(db, 'user_selection')
+            has_order = 'exercise_order' in columns
+            has_superset = 'superset_group' in columns
+            has_execution_style = 'execution_style' in columns
             
             # Build dynamic column selection
             extra_cols = []
@@ -588,11 +589,14 @@ def update_exercise():
         )
         return error_response("INTERNAL_ERROR", "Failed to update exercise", 500)
 
+def table_columns(db, table_name):
+    """Return the set of column names of a table using a single PRAGMA."""
+    query = f"PRAGMA table_info({table_name})"
+    return frozenset(col['name'] for col in db.fetch_all(query))
+
 def column_exists(db, table_name, column_name):
     """Check if a column exists in a table using PRAGMA."""
-    query = f"PRAGMA table_info({table_name})"
-    columns = db.fetch_all(query)
-    return any(col['name'] == column_name for col in columns)
+    return column_name in table_columns(db, table_name)
 
 def table_exists(db, table_name):
     """Check if a table exists in the database."""
@@ -1026,9 +1030,9 @@ def replace_exercise():
             candidates_query = """
                 SELECT exercise_name
                 FROM exercises
-                WHERE LOWER(primary_muscle_group) = LOWER(?)
-                  AND LOWER(equipment) = LOWER(?)
-                  AND LOWER(exercise_name) != LOWER(?)
+                WHERE primary_muscle_group = ? COLLATE NOCASE
+                  AND equipment = ? COLLATE NOCASE
+                  AND exercise_name != ? COLLATE NOCASE
             """
             candidate_rows = db.fetch_all(candidates_query, (muscle, equipment, current_exercise))
             candidate_names = [row['exercise_name'] for row in candidate_rows]
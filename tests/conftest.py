@@ -9,6 +9,7 @@ from pathlib import Path
 from flask import Flask
 from utils.database import DatabaseHandler, add_progression_goals_table, add_volume_tracking_tables
 from utils.db_initializer import initialize_database
+from utils.filter_cache import clear_cache
 from routes.workout_plan import workout_plan_bp, initialize_exercise_order
 from routes.filters import filters_bp
 from routes.workout_log import workout_log_bp
@@ -175,6 +176,8 @@ def clean_db(db_handler):
         ]
         for table in tables:
             db_handler.execute_query(f"DELETE FROM {table}")
+    # Cached filter results would otherwise outlive the rows they came from
+    clear_cache()
     
     yield db_handler
 
@@ -214,6 +217,7 @@ def exercise_factory(clean_db):
         )
         
         clean_db.execute_query(query, params)
+        clear_cache()
         return name
     
     return _create_exercise
@@ -0,0 +1,121 @@
+"""
+Tests for the connection pool behind utils/database.py DatabaseHandler.
+"""
+import gc
+import os
+import sqlite3
+
+import pytest
+
+from utils.database import (
+    _CHECKED_OUT,
+    DatabaseHandler,
+    _attempt_database_recovery,
+    close_idle_connections,
+    configure_bulk_connection,
+)
+
+
+@pytest.fixture
+def pool_db(tmp_path):
+    """Path to a throwaway database, with the idle pool emptied around the test."""
+    close_idle_connections()
+    yield str(tmp_path / "pool.db")
+    close_idle_connections()
+
+
+class TestConnectionPool:
+    """Tests for connection reuse across DatabaseHandler instances."""
+
+    def test_closed_handler_connection_is_reused(self, pool_db):
+        """A new handler should pick up the connection the last one released."""
+        with DatabaseHandler(pool_db) as db:
+            first = db.connection
+
+        with DatabaseHandler(pool_db) as db:
+            assert db.connection is first
+
+    def test_uncommitted_work_is_rolled_back_on_release(self, pool_db):
+        """Pooling should not carry an open transaction to the next handler."""
+        with DatabaseHandler(pool_db) as db:
+            db.execute_query("CREATE TABLE items (name TEXT)")
+
+        db = DatabaseHandler(pool_db)
+        db.execute_query("INSERT INTO items VALUES ('pending')", commit=False)
+        db.close()
+
+        with DatabaseHandler(pool_db) as db:
+            assert not db.connection.in_transaction
+            assert db.fetch_all("SELECT name FROM items") == []
+
+    def test_bulk_connection_is_not_pooled(self, pool_db):
+        """Connections given the bulk PRAGMAs should be closed, not reused."""
+        with DatabaseHandler(pool_db) as db:
+            configure_bulk_connection(db.connection)
+            bulk = db.connection
+
+        with DatabaseHandler(pool_db) as db:
+            assert db.connection is not bulk
+
+    def test_replaced_database_file_is_not_reused(self, pool_db):
+        """An idle connection to a deleted file should not serve the new file."""
+        with DatabaseHandler(pool_db) as db:
+            db.execute_query("CREATE TABLE old_table (id INTEGER)")
+            stale = db.connection
+
+        os.remove(pool_db)
+
+        with DatabaseHandler(pool_db) as db:
+            assert db.connection is not stale
+            tables = db.fetch_all("SELECT name FROM sqlite_master WHERE type = 'table'")
+            assert tables == []
+
+    def test_dropped_handler_returns_its_connection(self, pool_db):
+        """A handler collected without close() should not stay checked out."""
+        db = DatabaseHandler(pool_db)
+        leaked = db.connection
+        del db
+        gc.collect()
+
+        assert _CHECKED_OUT.get(pool_db, 0) == 0
+        with DatabaseHandler(pool_db) as db:
+            assert db.connection is leaked
+
+    def test_periodic_release_truncates_wal(self, pool_db, monkeypatch):
+        """Every POOL_CHECKPOINT_INTERVAL releases should checkpoint the WAL."""
+        monkeypatch.setattr("utils.database.POOL_CHECKPOINT_INTERVAL", 1)
+        with DatabaseHandler(pool_db) as db:
+            db.fetch_one("PRAGMA journal_mode = WAL")
+            db.execute_query("CREATE TABLE items (name TEXT)")
+            db.execute_query("INSERT INTO items VALUES ('logged')")
+            assert os.path.getsize(pool_db + "-wal") > 0
+
+        assert os.path.getsize(pool_db + "-wal") == 0
+
+
+class TestRecoveryWithPool:
+    """Tests for corruption recovery while connections are pooled."""
+
+    @pytest.fixture(autouse=True)
+    def _isolate_recovery(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("utils.database._RECOVERY_ATTEMPTS", {})
+        monkeypatch.setattr("utils.database.SEED_DB_PATH", tmp_path / "missing_seed.db")
+
+    def test_recovery_closes_idle_connections(self, pool_db):
+        """Quarantining the file should first close pooled connections to it."""
+        with DatabaseHandler(pool_db) as db:
+            idle = db.connection
+
+        assert _attempt_database_recovery(pool_db) is True
+        assert not os.path.exists(pool_db)
+        with pytest.raises(sqlite3.ProgrammingError):
+            idle.execute("SELECT 1")
+
+    def test_recovery_refused_while_connection_checked_out(self, pool_db):
+        """The file should not be moved from under an open handler."""
+        db = DatabaseHandler(pool_db)
+        try:
+            assert _attempt_database_recovery(pool_db) is False
+            assert os.path.exists(pool_db)
+        finally:
+            db.close()
@@ -0,0 +1,222 @@
+"""
+Tests for the normalisation passes in utils/db_initializer.py.
+"""
+import pytest
+from unittest.mock import patch
+
+from utils.database import DatabaseHandler
+from utils.db_initializer import (
+    _initialize_exercises_table,
+    _initialize_workout_log_table,
+    _normalize_muscle_group_values,
+    _populate_movement_patterns,
+)
+
+
+@pytest.fixture
+def catalogue_db(tmp_path):
+    """Fresh exercises table on a throwaway database."""
+    db = DatabaseHandler(str(tmp_path / "initializer.db"))
+    _initialize_exercises_table(db)
+    yield db
+    db.close()
+
+
+def _insert_exercises(db, rows):
+    db.executemany(
+        "INSERT INTO exercises (exercise_name, primary_muscle_group, "
+        "secondary_muscle_group, tertiary_muscle_group) VALUES (?, ?, ?, ?)",
+        rows,
+    )
+
+
+class TestNormalizeMuscleGroupValues:
+    """Tests for _normalize_muscle_group_values."""
+
+    def test_canonicalises_aliases_and_casing(self, catalogue_db):
+        """Aliases and lowercase labels should be rewritten to canonical names."""
+        _insert_exercises(
+            catalogue_db,
+            [
+                ("Bench Press", "chest", "triceps", "front shoulder"),
+                ("Crunch", "Obliques", None, ""),
+            ],
+        )
+
+        _normalize_muscle_group_values(catalogue_db)
+
+        rows = catalogue_db.fetch_all(
+            "SELECT exercise_name, primary_muscle_group, secondary_muscle_group, "
+            "tertiary_muscle_group FROM exercises ORDER BY exercise_name"
+        )
+        assert rows[0] == {
+            "exercise_name": "Bench Press",
+            "primary_muscle_group": "Chest",
+            "secondary_muscle_group": "Triceps",
+            "tertiary_muscle_group": "Front-Shoulder",
+        }
+        assert rows[1]["primary_muscle_group"] == "External Obliques"
+        assert rows[1]["secondary_muscle_group"] is None
+        assert rows[1]["tertiary_muscle_group"] == ""
+
+    def test_normalises_each_distinct_value_once(self, catalogue_db):
+        """Repeated labels should hit the normaliser once per distinct value."""
+        _insert_exercises(
+            catalogue_db,
+            [(f"Exercise {i}", "chest", "chest", None) for i in range(50)],
+        )
+
+        with patch(
+            "utils.db_initializer.normalize_muscle", return_value="Chest"
+        ) as mock_normalize:
+            _normalize_muscle_group_values(catalogue_db)
+
+        mock_normalize.assert_called_once_with("chest")
+        row = catalogue_db.fetch_one(
+            "SELECT COUNT(*) AS count FROM exercises "
+            "WHERE primary_muscle_group = 'Chest' AND secondary_muscle_group = 'Chest'"
+        )
+        assert row["count"] == 50
+
+    def test_failure_rolls_back_whole_pass(self, catalogue_db):
+        """A failing column update should leave every muscle column untouched."""
+        _insert_exercises(catalogue_db, [("Bench Press", "chest", "triceps", "chest")])
+        catalogue_db.execute_query(
+            "CREATE TRIGGER fail_tertiary BEFORE UPDATE OF tertiary_muscle_group ON exercises "
+            "BEGIN SELECT RAISE(ABORT, 'blocked'); END"
+        )
+
+        _normalize_muscle_group_values(catalogue_db)
+
+        row = catalogue_db.fetch_one(
+            "SELECT primary_muscle_group, secondary_muscle_group FROM exercises"
+        )
+        assert row == {"primary_muscle_group": "chest", "secondary_muscle_group": "triceps"}
+
+
+class TestPopulateMovementPatterns:
+    """Tests for _populate_movement_patterns."""
+
+    def test_populates_across_fetch_batches(self, catalogue_db, monkeypatch):
+        """Patterns should be written for every row even when streamed in small batches."""
+        monkeypatch.setattr("utils.db_initializer.PATTERN_BATCH_ROWS", 2)
+        _insert_exercises(
+            catalogue_db,
+            [(f"Barbell Bench Press {i}", "Chest", "Triceps", None) for i in range(5)],
+        )
+
+        _populate_movement_patterns(catalogue_db)
+
+        rows = catalogue_db.fetch_all(
+            "SELECT movement_pattern FROM exercises WHERE movement_pattern IS NOT NULL"
+        )
+        assert len(rows) == 5
+
+    def test_updates_written_once_after_scan(self, catalogue_db, monkeypatch):
+        """Updates should not run while the batched SELECT is still open."""
+        monkeypatch.setattr("utils.db_initializer.PATTERN_BATCH_ROWS", 2)
+        _insert_exercises(
+            catalogue_db,
+            [(f"Barbell Bench Press {i}", "Chest", "Triceps", None) for i in range(5)],
+        )
+        calls = []
+        original = catalogue_db.executemany
+
+        def _recording_executemany(query, params, **kwargs):
+            calls.append(len(params))
+            return original(query, params, **kwargs)
+
+        monkeypatch.setattr(catalogue_db, "executemany", _recording_executemany)
+
+        _populate_movement_patterns(catalogue_db)
+
+        assert calls == [5]
+
+
+class TestExerciseLookupIndexes:
+    """Tests for the exercise indexes behind the filter dropdowns."""
+
+    def test_distinct_values_walk_column_index(self, catalogue_db):
+        """Distinct muscle group lookups should not build a temp B-tree."""
+        plan = catalogue_db.fetch_all(
+            "EXPLAIN QUERY PLAN SELECT DISTINCT primary_muscle_group AS value "
+            "FROM exercises WHERE primary_muscle_group IS NOT NULL "
+            "AND TRIM(primary_muscle_group) <> '' ORDER BY primary_muscle_group"
+        )
+        details = " ".join(row["detail"] for row in plan)
+        assert "idx_exercises_primary_muscle_group" in details
+        assert "TEMP B-TREE" not in details
+
+    def test_exact_filters_seek_nocase_index(self, catalogue_db):
+        """Case-insensitive equality filters should search the NOCASE index."""
+        from utils.filter_predicates import FilterPredicates
+
+        query, params = FilterPredicates.build_filter_query({"equipment": "barbell"})
+        plan = catalogue_db.fetch_all("EXPLAIN QUERY PLAN " + query, tuple(params))
+        details = " ".join(row["detail"] for row in plan)
+        assert "SEARCH exercises USING INDEX idx_exercises_equipment_nocase" in details
+
+
+class TestWorkoutLogIndexes:
+    """Tests for the workout_log indexes used by export queries."""
+
+    def test_recent_log_query_uses_created_at_index(self, catalogue_db):
+        """Newest-first reads should walk the created_at index, not sort."""
+        _initialize_workout_log_table(catalogue_db)
+
+        plan = catalogue_db.fetch_all(
+            "EXPLAIN QUERY PLAN SELECT * FROM workout_log ORDER BY created_at DESC LIMIT 10"
+        )
+        details = " ".join(row["detail"] for row in plan)
+        assert "idx_workout_log_created_at" in details
+        assert "TEMP B-TREE" not in details
+
+    def test_exercise_lookup_uses_exercise_index(self, catalogue_db):
+        """Filtering the log by exercise should probe idx_workout_log_exercise."""
+        _initialize_workout_log_table(catalogue_db)
+
+        plan = catalogue_db.fetch_all(
+            "EXPLAIN QUERY PLAN SELECT id FROM workout_log WHERE exercise = ?",
+            ("Bench Press",),
+        )
+        assert "idx_workout_log_exercise" in " ".join(row["detail"] for row in plan)
+
+    def test_date_window_uses_created_at_index(self, catalogue_db):
+        """The widened raw date window should search the plain created_at index."""
+        _initialize_workout_log_table(catalogue_db)
+
+        plan = catalogue_db.fetch_all(
+            "EXPLAIN QUERY PLAN SELECT id FROM workout_log wl "
+            "WHERE wl.created_at >= DATE(?, '-1 day') AND DATE(wl.created_at) >= DATE(?) "
+            "AND wl.created_at < DATE(?, '+2 days') AND DATE(wl.created_at) <= DATE(?)",
+            ("2024-01-01", "2024-01-01", "2024-01-31", "2024-01-31"),
+        )
+        details = " ".join(row["detail"] for row in plan)
+        assert "idx_workout_log_created_at" in details
+
+    def test_workout_log_index_set(self, catalogue_db):
+        """Each log insert should maintain only the three indexes the queries use."""
+        _initialize_workout_log_table(catalogue_db)
+
+        rows = catalogue_db.fetch_all(
+            "SELECT name FROM sqlite_master WHERE type = 'index' "
+            "AND tbl_name = 'workout_log' AND sql IS NOT NULL"
+        )
+        assert {row["name"] for row in rows} == {
+            "idx_workout_log_exercise",
+            "idx_workout_log_created_at",
+            "idx_workout_log_scored_created_at",
+        }
+
+    def test_scored_session_query_uses_partial_index(self, catalogue_db):
+        """Scored-only newest-first reads should walk the partial index."""
+        from routes.exports import STREAMED_SESSION_SUMMARY_QUERY
+
+        _initialize_workout_log_table(catalogue_db)
+
+        plan = catalogue_db.fetch_all(
+            "EXPLAIN QUERY PLAN " + STREAMED_SESSION_SUMMARY_QUERY, (100,)
+        )
+        details = " ".join(row["detail"] for row in plan)
+        assert "idx_workout_log_scored_created_at" in details
+        assert "TEMP B-TREE" not in details
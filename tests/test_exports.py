@@ -145,6 +145,190 @@ class TestExportSizeEstimation:
         assert result is True
 
 
+class TestWorkbookStreaming:
+    """Tests for streaming finished workbooks from their temporary file."""
+    
+    def test_workbook_streamed_and_temp_file_removed(self, app, monkeypatch):
+        """The response should stream the file and delete it once closed."""
+        import os
+        import utils.export_utils as export_utils
+        
+        removed = []
+        original_remove = export_utils._remove_temp_file
+        
+        def tracking_remove(path):
+            removed.append(path)
+            original_remove(path)
+        
+        monkeypatch.setattr(export_utils, '_remove_temp_file', tracking_remove)
+        
+        with app.test_request_context():
+            response = export_utils.create_excel_workbook(
+                {'Sheet': [{'a': 1, 'b': 'x'}]}, 'test.xlsx'
+            )
+            assert response.is_streamed
+            body = b''.join(response.response)
+            assert len(body) == int(response.headers['Content-Length'])
+            response.close()
+        
+        assert load_workbook(BytesIO(body))['Sheet']['B2'].value == 'x'
+        assert len(removed) == 1 and not os.path.exists(removed[0])
+
+    def test_stream_excel_response_writes_rows_and_cleans_up(self, app, monkeypatch):
+        """Generator-fed exports should write every row and remove their temp file."""
+        import os
+        import utils.export_utils as export_utils
+
+        removed = []
+        original_remove = export_utils._remove_temp_file
+
+        def tracking_remove(path):
+            removed.append(path)
+            original_remove(path)
+
+        monkeypatch.setattr(export_utils, '_remove_temp_file', tracking_remove)
+
+        def sheets():
+            yield 'Rows', [{'n': i, 'label': f'row {i}'} for i in range(50)]
+            yield 'Empty', []
+
+        with app.test_request_context():
+            response = export_utils.stream_excel_response(sheets(), 'test.xlsx')
+            body = b''.join(response.response)
+
+        wb = load_workbook(BytesIO(body))
+        assert wb.sheetnames == ['Rows']
+        assert wb['Rows'].max_row == 51
+        assert wb['Rows']['B51'].value == 'row 49'
+        assert len(removed) == 1 and not os.path.exists(removed[0])
+
+
+class TestPlainWorkbook:
+    """Tests for the direct-XML writer behind stream_excel_response."""
+    
+    def test_cell_types_gaps_and_escaping(self, tmp_path):
+        """Numbers stay numeric, NULLs leave gaps and markup is escaped."""
+        import sqlite3
+        from utils.export_utils import _write_plain_workbook
+        
+        conn = sqlite3.connect(':memory:')
+        cursor = conn.execute(
+            "SELECT 1 AS id, NULL AS plan_id, 'Bench <&> \"Press\"' AS exercise, 82.5 AS weight"
+        )
+        path = str(tmp_path / 'plain.xlsx')
+        
+        written = _write_plain_workbook(path, [
+            ('Workout Log', cursor),
+            ('Summary', [{'Muscle': 'Chest', 'Sets': 12}]),
+            ('Empty', []),
+        ])
+        conn.close()
+        
+        wb = load_workbook(path)
+        assert written == 2
+        assert wb.sheetnames == ['Workout Log', 'Summary']
+        log = wb['Workout Log']
+        assert [cell.value for cell in log[1]] == ['id', 'plan_id', 'exercise', 'weight']
+        assert [cell.value for cell in log[2]] == [1, None, 'Bench <&> "Press"', 82.5]
+        assert wb['Summary']['B2'].value == 12
+
+    def test_bools_written_as_boolean_cells(self, tmp_path):
+        """Bools should be boolean cells, as xlsxwriter writes them, not text."""
+        from utils.export_utils import _write_plain_workbook
+
+        path = str(tmp_path / 'bools.xlsx')
+        _write_plain_workbook(path, [('Flags', [{'Done': True, 'Skipped': False}])])
+
+        sheet = load_workbook(path)['Flags']
+        assert sheet['A2'].value is True
+        assert sheet['B2'].value is False
+        assert sheet['A2'].data_type == 'b'
+
+    def test_no_sheets_still_produces_valid_workbook(self, tmp_path):
+        """An export with nothing to write still yields an openable workbook."""
+        from utils.export_utils import _write_plain_workbook
+        
+        path = str(tmp_path / 'empty.xlsx')
+        _write_plain_workbook(path, [('Empty', [])])
+        
+        assert load_workbook(path).sheetnames == ['Sheet1']
+
+
+class TestReorderAndRenameColumns:
+    """Tests for reorder_and_rename_columns."""
+    
+    def test_orders_renames_and_drops_internal_columns(self):
+        """Columns follow the UI order, extras go last, internal ids are dropped."""
+        from routes.exports import reorder_and_rename_columns, WORKOUT_PLAN_COLUMNS
+        
+        rows = [
+            {'id': 1, 'notes': 'n1', 'exercise': 'Bench', 'routine': 'A',
+             'primary_muscle_group': 'Chest'},
+            {'id': 2, 'notes': 'n2', 'exercise': 'Row', 'routine': 'B',
+             'primary_muscle_group': 'Lats'},
+        ]
+        
+        result = reorder_and_rename_columns(rows, WORKOUT_PLAN_COLUMNS)
+        
+        assert list(result[0]) == ['Routine', 'Exercise', 'Primary Muscle', 'notes']
+        assert result[1] == {'Routine': 'B', 'Exercise': 'Row',
+                             'Primary Muscle': 'Lats', 'notes': 'n2'}
+    
+    def test_accepts_sqlite_rows(self):
+        """sqlite3.Row input should be re-keyed without converting to dicts first."""
+        import sqlite3
+        from routes.exports import reorder_and_rename_columns, WORKOUT_PLAN_COLUMNS
+        
+        conn = sqlite3.connect(':memory:')
+        conn.row_factory = sqlite3.Row
+        rows = conn.execute(
+            "SELECT 7 AS id, 'Bench' AS exercise, 'A' AS routine, 3 AS sets"
+        ).fetchall()
+        conn.close()
+        
+        result = reorder_and_rename_columns(rows, WORKOUT_PLAN_COLUMNS)
+        
+        assert result == [{'Routine': 'A', 'Exercise': 'Bench', 'Sets': 3}]
+    
+    def test_advanced_view_maps_muscle_values(self):
+        """Advanced view should rename muscle values but leave other columns alone."""
+        from routes.exports import reorder_and_rename_columns, WORKOUT_PLAN_COLUMNS
+        
+        rows = [{'exercise': 'Chest', 'primary_muscle_group': 'Chest',
+                 'secondary_muscle_group': None}]
+        
+        result = reorder_and_rename_columns(rows, WORKOUT_PLAN_COLUMNS, 'advanced')
+        
+        assert result == [{'Exercise': 'Chest',
+                           'Primary Muscle Group': 'Upper / Lower Pectoralis',
+                           'Secondary Muscle Group': None}]
+
+
+class TestOrderPlanSupersets:
+    """Tests for order_plan_supersets."""
+    
+    def test_superset_members_follow_first_member(self):
+        """Superset members are pulled up to their first member's position."""
+        from routes.exports import order_plan_supersets
+        
+        def row(routine, exercise, order, group=None):
+            return {'routine': routine, 'exercise': exercise,
+                    'exercise_order': order, 'superset_group': group}
+        
+        rows = [
+            row('A', 'Bench', 1, 'S1'),
+            row('A', 'Curl', 2),
+            row('A', 'Row', 3, 'S1'),
+            row('B', 'Squat', 1),
+            row('B', 'Lunge', 2, 'S2'),
+            row('B', 'Calf Raise', 2),
+        ]
+        
+        ordered = [r['exercise'] for r in order_plan_supersets(rows)]
+        
+        assert ordered == ['Bench', 'Row', 'Curl', 'Squat', 'Lunge', 'Calf Raise']
+
+
 class TestExportsEndpoints:
     """Test export endpoints with actual requests."""
     
@@ -170,6 +354,101 @@ class TestExportsEndpoints:
         sheet_names = wb.sheetnames
         assert 'Workout Plan' in sheet_names or len(sheet_names) >= 1
     
+    def test_export_to_excel_streams_workout_log(self, client, sample_workout_log):
+        """Cursor-backed sheets should be written with a header and every row."""
+        response = client.get('/export_to_excel')
+        
+        assert response.status_code == 200
+        wb = load_workbook(BytesIO(response.data))
+        assert 'Workout Log' in wb.sheetnames
+        sheet = wb['Workout Log']
+        headers = [cell.value for cell in sheet[1]]
+        assert 'exercise' in headers and 'scored_weight' in headers
+        assert sheet.max_row == 11  # header + 10 rows
+    
+    def test_export_to_excel_recalculates_exercise_order(
+        self, client, db_handler, exercise_factory, workout_plan_factory
+    ):
+        """Uniform exercise_order values should be renumbered by routine/exercise."""
+        from routes.workout_plan import column_exists
+        if not column_exists(db_handler, 'user_selection', 'exercise_order'):
+            db_handler.execute_query(
+                "ALTER TABLE user_selection ADD COLUMN exercise_order INTEGER"
+            )
+        for routine, name in [("B", "Squat"), ("A", "Row"), ("A", "Curl")]:
+            workout_plan_factory(exercise_factory(name), routine=routine)
+        db_handler.execute_query("UPDATE user_selection SET exercise_order = 1")
+        
+        response = client.get('/export_to_excel')
+        
+        assert response.status_code == 200
+        rows = db_handler.fetch_all(
+            "SELECT routine, exercise, exercise_order FROM user_selection "
+            "ORDER BY exercise_order"
+        )
+        assert [(r['routine'], r['exercise'], r['exercise_order']) for r in rows] == [
+            ("A", "Curl", 1), ("A", "Row", 2), ("B", "Squat", 3)
+        ]
+
+    def test_exercise_order_fallback_matches_update_from(
+        self, client, db_handler, exercise_factory, workout_plan_factory, monkeypatch
+    ):
+        """The pre-3.33 correlated UPDATE should number rows the same way."""
+        import routes.exports as exports
+        from routes.workout_plan import column_exists
+        if not column_exists(db_handler, 'user_selection', 'exercise_order'):
+            db_handler.execute_query(
+                "ALTER TABLE user_selection ADD COLUMN exercise_order INTEGER"
+            )
+        for routine, name in [("B", "Squat"), ("A", "Row"), ("A", "Curl")]:
+            workout_plan_factory(exercise_factory(name), routine=routine)
+        db_handler.execute_query("UPDATE user_selection SET exercise_order = 1")
+        monkeypatch.setattr(
+            exports, 'EXERCISE_ORDER_RECALC_QUERY', exports._ORDER_RECALC_CORRELATED
+        )
+
+        response = client.get('/export_to_excel')
+
+        assert response.status_code == 200
+        rows = db_handler.fetch_all(
+            "SELECT routine, exercise, exercise_order FROM user_selection "
+            "ORDER BY exercise_order"
+        )
+        assert [(r['routine'], r['exercise'], r['exercise_order']) for r in rows] == [
+            ("A", "Curl", 1), ("A", "Row", 2), ("B", "Squat", 3)
+        ]
+
+    def test_export_to_excel_uses_bulk_pragmas(self, client, monkeypatch):
+        """The export connection should get the bulk read PRAGMAs."""
+        import routes.exports as exports
+        
+        temp_stores = []
+        original = exports.configure_bulk_connection
+        
+        def tracking(connection):
+            original(connection)
+            temp_stores.append(connection.execute("PRAGMA temp_store").fetchone()[0])
+            return connection
+        
+        monkeypatch.setattr(exports, 'configure_bulk_connection', tracking)
+        
+        response = client.get('/export_to_excel')
+        
+        assert response.status_code == 200
+        assert temp_stores == [2]  # MEMORY
+    
+    def test_session_summary_export_reads_newest_first_by_index(self, db_handler):
+        """The session summary sheet should walk the created_at index, not sort."""
+        from routes.exports import SESSION_SUMMARY_EXPORT_QUERY
+        
+        plan = db_handler.fetch_all(
+            "EXPLAIN QUERY PLAN " + SESSION_SUMMARY_EXPORT_QUERY, (100,)
+        )
+        details = " ".join(row["detail"] for row in plan)
+        
+        assert "idx_workout_log_created_at" in details
+        assert "TEMP B-TREE" not in details
+    
     def test_export_to_excel_filename_timestamp(self, client):
         """Test that exported filename includes timestamp."""
         response = client.get('/export_to_excel')
@@ -243,6 +522,7 @@ class TestExportsEndpoints:
         assert response.status_code == 200
         wb = load_workbook(BytesIO(response.data))
         assert 'Workout Log' in wb.sheetnames
+        assert wb['Workout Log'].max_row == 1001  # header + every streamed row
     
     def test_export_large_dataset_session_summary_only(self, client, large_workout_log):
         """Test streaming export with session summary only."""
@@ -347,6 +627,45 @@ class TestExportErrorHandling:
         assert int(response.headers.get('Content-Length', '0')) > 0
 
 
+class TestVolumeAndFrequencyBulk:
+    """Tests for the grouped volume/frequency aggregation."""
+
+    def test_bulk_matches_all_muscle_columns(
+        self, clean_db, workout_plan_factory, workout_log_factory
+    ):
+        """Each muscle column and isolated mapping should be aggregated once per log row."""
+        from routes.exports import calculate_volume_and_frequency_bulk
+
+        plan_id = workout_plan_factory()
+        workout_log_factory(plan_id=plan_id)
+        workout_log_factory(plan_id=plan_id)
+        clean_db.execute_query(
+            "INSERT INTO exercise_isolated_muscles (exercise_name, muscle) VALUES (?, ?), (?, ?)",
+            ("Test Exercise", "Chest", "Test Exercise", "Upper Pectoralis"),
+        )
+
+        results = calculate_volume_and_frequency_bulk(clean_db)
+
+        assert set(results) == {"Chest", "Triceps", "Shoulders", "Upper Pectoralis"}
+        # 2 rows x 52.5 kg x 8 reps x 3 sets, not doubled by the Chest mapping
+        assert results["Chest"] == {"total_volume": 2520.0, "frequency": 1}
+        assert results["Upper Pectoralis"]["total_volume"] == 2520.0
+
+    def test_category_helpers_read_bulk_result(self, clean_db, workout_log_factory):
+        """The per-category helpers should dispatch from the bulk aggregate."""
+        from routes.exports import (
+            calculate_frequency_for_category,
+            calculate_volume_for_category,
+        )
+
+        workout_log_factory()
+
+        assert calculate_volume_for_category("Primary", "Chest") == 1260.0
+        assert calculate_frequency_for_category("Primary", "Chest") == 1
+        assert calculate_volume_for_category("Primary", "Calves") == 0
+        assert calculate_frequency_for_category("Primary", "Calves") == 0
+
+
 # Fixtures for tests
 
 @pytest.fixture
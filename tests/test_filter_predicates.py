@@ -55,10 +55,10 @@ class TestBuildFilterQuery:
         assert params == []
 
     def test_single_exact_match_filter(self):
-        """Single exact match filter should use LOWER() comparison."""
+        """Single exact match filter should compare case-insensitively."""
         filters = {"equipment": "Barbell"}
         query, params = FilterPredicates.build_filter_query(filters)
-        assert "LOWER(equipment) = LOWER(?)" in query
+        assert "equipment = ? COLLATE NOCASE" in query
         assert "Barbell" in params
 
     def test_single_partial_match_filter(self):
@@ -137,11 +137,11 @@ class TestBuildFilterQuery:
     # ─────────────────────────────────────────────────────────────────────
     # Advanced isolated muscles special handling
     # ─────────────────────────────────────────────────────────────────────
-    def test_advanced_isolated_muscles_uses_exists_subquery(self):
-        """advanced_isolated_muscles should use EXISTS subquery."""
+    def test_advanced_isolated_muscles_uses_in_subquery(self):
+        """advanced_isolated_muscles should use an uncorrelated IN subquery."""
         filters = {"advanced_isolated_muscles": "biceps"}
         query, params = FilterPredicates.build_filter_query(filters)
-        assert "EXISTS" in query
+        assert "exercise_name IN (SELECT m.exercise_name" in query
         assert "exercise_isolated_muscles" in query
         assert "%biceps%" in params
 
@@ -150,7 +150,13 @@ class TestBuildFilterQuery:
         filters = {"advanced_isolated_muscles": "deltoid"}
         query, params = FilterPredicates.build_filter_query(filters)
         assert "m.muscle LIKE ?" in query
-        assert "m.exercise_name = exercises.exercise_name" in query
+        assert "m.exercise_name = exercises.exercise_name" not in query
+
+    def test_isolated_muscle_condition_ors_patterns(self):
+        """Several patterns should share one mapping-table subquery."""
+        condition = FilterPredicates.isolated_muscle_condition(3)
+        assert condition.count("m.muscle LIKE ?") == 3
+        assert condition.count("SELECT") == 1
 
     # ─────────────────────────────────────────────────────────────────────
     # Custom base query
@@ -357,6 +363,16 @@ class TestComplexFilterScenarios:
         assert "%Chest%" in params
         assert "%Triceps%" in params
 
+    def test_filter_order_does_not_change_query_text(self):
+        """The same filter set should build identical SQL in any key order."""
+        first = FilterPredicates.build_filter_query(
+            {"equipment": "Barbell", "primary_muscle_group": "Chest"}
+        )
+        second = FilterPredicates.build_filter_query(
+            {"primary_muscle_group": "Chest", "equipment": "Barbell"}
+        )
+        assert first == second
+
     def test_mixed_exact_and_partial_filters(self):
         """Mix of exact and partial match filters."""
         filters = {
@@ -364,7 +380,7 @@ class TestComplexFilterScenarios:
             "primary_muscle_group": "Chest",  # Partial
         }
         query, params = FilterPredicates.build_filter_query(filters)
-        assert "LOWER(equipment) = LOWER(?)" in query
+        assert "equipment = ? COLLATE NOCASE" in query
         assert "primary_muscle_group LIKE ?" in query
 
     def test_all_filter_types_combined(self):
@@ -379,6 +395,6 @@ class TestComplexFilterScenarios:
         query, params = FilterPredicates.build_filter_query(filters)
         # Should have conditions for all filters
         assert len(params) == 5
-        assert "EXISTS" in query  # For advanced_isolated_muscles
+        assert "exercise_isolated_muscles" in query  # For advanced_isolated_muscles
         assert "LIKE" in query  # For muscle groups
-        assert "LOWER" in query  # For exact match fields
+        assert "COLLATE NOCASE" in query  # For exact match fields
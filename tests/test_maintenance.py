@@ -5,6 +5,7 @@ Tests for utils/maintenance.py - Database maintenance and normalization.
 import pytest
 from unittest.mock import patch, MagicMock, call
 import sqlite3
+from utils.database import DatabaseHandler
 from utils.maintenance import (
     _exec_many,
     _normalize_existing_rows,
@@ -110,57 +111,83 @@ class TestExecMany:
         mock_db.connection.commit.assert_called_once()
 
 
+@pytest.fixture
+def exercises_db(tmp_path):
+    """Minimal exercises table on a throwaway database."""
+    db = DatabaseHandler(str(tmp_path / "maintenance.db"))
+    db.execute_query(
+        "CREATE TABLE exercises (exercise_name TEXT PRIMARY KEY, advanced_isolated_muscles TEXT)"
+    )
+    yield db
+    db.close()
+
+
+def _advanced_values(db):
+    rows = db.fetch_all(
+        "SELECT exercise_name, advanced_isolated_muscles FROM exercises ORDER BY exercise_name"
+    )
+    return {row["exercise_name"]: row["advanced_isolated_muscles"] for row in rows}
+
+
 class TestNormalizeExistingRows:
     """Tests for _normalize_existing_rows function."""
 
     @patch('utils.maintenance.normalize_advanced_muscles')
-    def test_normalizes_rows(self, mock_normalize):
+    def test_normalizes_rows(self, mock_normalize, exercises_db):
         """Should normalize advanced_isolated_muscles values."""
-        mock_db = MagicMock()
-        mock_db.fetch_all.return_value = [
-            {"rid": 1, "advanced_isolated_muscles": "bicep; tricep"},
-            {"rid": 2, "advanced_isolated_muscles": "chest"},
-        ]
-        mock_normalize.side_effect = [
-            ["bicep", "tricep"],  # Normalized version
-            ["chest"],
-        ]
-        
-        _normalize_existing_rows(mock_db)
-        
-        mock_db.fetch_all.assert_called_once()
+        exercises_db.executemany(
+            "INSERT INTO exercises VALUES (?, ?)",
+            [("Curl", "bicep; tricep"), ("Fly", "chest")],
+        )
+        mock_normalize.side_effect = lambda raw: {
+            "bicep; tricep": ["bicep", "tricep"],
+            "chest": ["chest"],
+        }[raw]
+
+        _normalize_existing_rows(exercises_db)
+
+        assert _advanced_values(exercises_db) == {"Curl": "bicep, tricep", "Fly": "chest"}
+        # Each distinct raw value is normalised once
         assert mock_normalize.call_count == 2
 
     @patch('utils.maintenance.normalize_advanced_muscles')
-    def test_updates_only_changed_rows(self, mock_normalize):
+    def test_updates_only_changed_rows(self, mock_normalize, exercises_db):
         """Should only update rows that changed."""
-        mock_db = MagicMock()
-        mock_db.fetch_all.return_value = [
-            {"rid": 1, "advanced_isolated_muscles": "bicep, tricep"},  # Already normalized
-            {"rid": 2, "advanced_isolated_muscles": "chest; back"},  # Needs normalizing
-        ]
-        mock_normalize.side_effect = [
-            ["bicep", "tricep"],  # Same as input (comma-separated)
-            ["chest", "back"],  # Different from input (had semicolons)
-        ]
-        
-        _normalize_existing_rows(mock_db)
-        
-        # executemany should be called with updates
-        mock_db.executemany.assert_called()
+        exercises_db.executemany(
+            "INSERT INTO exercises VALUES (?, ?)",
+            [("Curl", "bicep, tricep"), ("Row", "chest; back")],
+        )
+        mock_normalize.side_effect = lambda raw: [t.strip() for t in raw.replace(";", ",").split(",")]
+
+        _normalize_existing_rows(exercises_db)
+
+        assert exercises_db.cursor.rowcount == 1
+        assert _advanced_values(exercises_db) == {"Curl": "bicep, tricep", "Row": "chest, back"}
 
     @patch('utils.maintenance.normalize_advanced_muscles')
-    def test_handles_null_values(self, mock_normalize):
-        """Should handle null advanced_isolated_muscles."""
-        mock_db = MagicMock()
-        mock_db.fetch_all.return_value = [
-            {"rid": 1, "advanced_isolated_muscles": None},
-        ]
+    def test_handles_null_values(self, mock_normalize, exercises_db):
+        """Should handle null and empty advanced_isolated_muscles."""
+        exercises_db.executemany(
+            "INSERT INTO exercises VALUES (?, ?)",
+            [("Plank", None), ("Crunch", "")],
+        )
         mock_normalize.return_value = []
-        
-        _normalize_existing_rows(mock_db)
-        
-        # Should not raise
+
+        _normalize_existing_rows(exercises_db)
+
+        assert exercises_db.cursor.rowcount == 0
+        assert _advanced_values(exercises_db) == {"Crunch": "", "Plank": None}
+
+    def test_uses_real_normalizer(self, exercises_db):
+        """Should canonicalise synonyms and separators with the real normaliser."""
+        exercises_db.execute_query(
+            "INSERT INTO exercises VALUES (?, ?)",
+            ("Hip Thrust", "Gluteus Maximus; glutes"),
+        )
+
+        _normalize_existing_rows(exercises_db)
+
+        assert _advanced_values(exercises_db) == {"Hip Thrust": "gluteus-maximus"}
 
 
 class TestNormalizeAndRebuildEim:
@@ -203,6 +230,21 @@ class TestNormalizeAndRebuildEim:
         create_call = mock_db.execute_query.call_args
         assert "CREATE TABLE IF NOT EXISTS exercise_isolated_muscles" in create_call[0][0]
 
+    @patch('utils.maintenance.invalidate_cache')
+    @patch('utils.maintenance._normalize_existing_rows')
+    @patch('utils.maintenance._exec_many')
+    @patch('utils.maintenance.DatabaseHandler')
+    def test_invalidates_exercise_cache(self, mock_db_class, mock_exec_many, mock_normalize, mock_invalidate):
+        """Should drop cached exercise filter results once the rows are rewritten."""
+        mock_db = MagicMock()
+        mock_db.__enter__ = MagicMock(return_value=mock_db)
+        mock_db.__exit__ = MagicMock(return_value=False)
+        mock_db_class.return_value = mock_db
+
+        normalize_and_rebuild_eim()
+
+        mock_invalidate.assert_called_once_with('exercises')
+
     @patch('utils.maintenance._normalize_existing_rows')
     @patch('utils.maintenance._exec_many')
     @patch('utils.maintenance.DatabaseHandler')
@@ -276,12 +318,9 @@ class TestEdgeCases:
         assert mock_db.execute_query.call_count == 2
 
     @patch('utils.maintenance.normalize_advanced_muscles')
-    def test_normalize_handles_empty_db(self, mock_normalize):
+    def test_normalize_handles_empty_db(self, mock_normalize, exercises_db):
         """Should handle empty exercises table."""
-        mock_db = MagicMock()
-        mock_db.fetch_all.return_value = []
-        
-        _normalize_existing_rows(mock_db)
+        _normalize_existing_rows(exercises_db)
         
         mock_normalize.assert_not_called()
-        mock_db.executemany.assert_not_called()
+        assert exercises_db.cursor.rowcount == 0
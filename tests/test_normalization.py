@@ -1,7 +1,11 @@
 import pytest
 
 from utils.normalization import (
+    CANONICAL_MUSCLE_LABELS,
+    _normalize_advanced_string,
     clean_token,
+    normalize_advanced_muscles,
+    normalize_advanced_token,
     normalize_difficulty,
     normalize_equipment,
     normalize_exercise_row,
@@ -76,4 +80,24 @@ def test_normalize_exercise_row_deduplicates_isolations():
     assert normalised['mechanic'] == 'Isolation'
     assert normalised['difficulty'] == 'Advanced'
     assert normalised['equipment'] == 'Smith_Machine'
-    assert normalised['grips'] == 'Neutral, Overhand'
\ No newline at end of file
+    assert normalised['grips'] == 'Neutral, Overhand'
+
+def test_normalize_advanced_muscles_reuses_cached_tokens():
+    # Both caches are cleared so the hit counts do not depend on earlier calls
+    _normalize_advanced_string.cache_clear()
+    normalize_advanced_token.cache_clear()
+    first = normalize_advanced_muscles('Gluteus Maximus, glutes')
+    second = normalize_advanced_muscles('glutes; Gluteus Maximus')
+    repeat = normalize_advanced_muscles('glutes; Gluteus Maximus')
+
+    assert first == ['gluteus-maximus']
+    assert second == ['gluteus-maximus']
+    assert repeat == ['gluteus-maximus']
+    assert normalize_advanced_token.cache_info().hits == 2
+    assert _normalize_advanced_string.cache_info().hits == 1
+
+
+def test_canonical_muscle_labels_are_fixed_points():
+    assert 'Chest' in CANONICAL_MUSCLE_LABELS
+    assert 'chest' not in CANONICAL_MUSCLE_LABELS
+    assert all(normalize_muscle(label) == label for label in CANONICAL_MUSCLE_LABELS)
@@ -174,6 +174,68 @@ class TestGetUniqueValuesWhitelist:
         assert data['error']['code'] == 'VALIDATION_ERROR'
 
 
+class TestFilterResultCache:
+    """Test that catalogue lookups are cached until the catalogue changes."""
+    
+    def test_repeated_filter_served_from_cache(self, client, exercise_factory, db_handler):
+        """A repeated filter should not see rows written behind the cache's back."""
+        exercise_factory("Bench Press", primary_muscle_group="Chest")
+        payload = {"Primary Muscle Group": "Chest"}
+        
+        first = client.post('/filter_exercises', json=payload).get_json()['data']
+        db_handler.execute_query(
+            "INSERT INTO exercises (exercise_name, primary_muscle_group) VALUES (?, ?)",
+            ("Incline Press", "Chest"),
+        )
+        second = client.post('/filter_exercises', json=payload).get_json()['data']
+        
+        assert first == second == ["Bench Press"]
+    
+    def test_catalogue_write_invalidates_unique_values(self, client, exercise_factory):
+        """Removing an exercise through ExerciseManager should refresh cached values."""
+        from utils.exercise_manager import ExerciseManager
+        
+        exercise_factory("Bench Press", primary_muscle_group="Chest")
+        exercise_factory("Squat", primary_muscle_group="Quadriceps")
+        url = '/get_unique_values/exercises/primary_muscle_group'
+        assert "Quadriceps" in client.get(url).get_json()['data']
+        
+        ExerciseManager.remove_exercise_by_name("Squat")
+        
+        assert client.get(url).get_json()['data'] == ["Chest"]
+
+    
+    def test_warmed_values_served_without_database(self, app, client, exercise_factory, monkeypatch):
+        """After warm_unique_values, dropdown requests should not open a connection."""
+        from routes.filters import warm_unique_values
+        
+        exercise_factory("Bench Press", force="push")
+        with app.app_context():
+            warm_unique_values()
+        
+        def _no_connection(*args, **kwargs):
+            raise AssertionError("unexpected DatabaseHandler()")
+        
+        monkeypatch.setattr('routes.filters.DatabaseHandler', _no_connection)
+        response = client.get('/get_unique_values/exercises/force')
+        
+        assert response.status_code == 200
+        assert response.get_json()['data'] == ["Push"]
+
+    def test_empty_unique_values_not_cached(self, client, exercise_factory, db_handler):
+        """An empty dropdown should be re-queried rather than cached."""
+        exercise_factory("Bench Press", equipment=None)
+        url = '/get_unique_values/exercises/equipment'
+        assert client.get(url).get_json()['data'] == []
+
+        db_handler.execute_query(
+            "UPDATE exercises SET equipment = ? WHERE exercise_name = ?",
+            ("Barbell", "Bench Press"),
+        )
+
+        assert client.get(url).get_json()['data'] == ["Barbell"]
+
+
 class TestGetFilteredExercisesWhitelist:
     """Test get_filtered_exercises endpoint with whitelist validation."""
     
@@ -190,6 +252,21 @@ class TestGetFilteredExercisesWhitelist:
         assert data['ok'] is True
         assert "Bench Press" in data['data']
     
+    def test_enumerated_columns_match_exactly(self, client, exercise_factory):
+        """Enumerated columns match whole values case-insensitively; others stay partial."""
+        exercise_factory("Bench Press", equipment="Barbell", primary_muscle_group="Chest")
+        exercise_factory("Cable Fly", equipment="Cable", primary_muscle_group="Upper Chest")
+        
+        exact = client.post('/get_filtered_exercises', json={"equipment": "barbell"})
+        partial_enum = client.post('/get_filtered_exercises', json={"equipment": "Bar"})
+        partial_muscle = client.post('/get_filtered_exercises', json={
+            "equipment": "Cable", "primary_muscle_group": "Chest"
+        })
+        
+        assert exact.get_json()['data'] == ["Bench Press"]
+        assert partial_enum.get_json()['data'] == []
+        assert partial_muscle.get_json()['data'] == ["Cable Fly"]
+    
     def test_invalid_column_rejected(self, client):
         """Test that invalid column names return 400."""
         response = client.post('/get_filtered_exercises', json={
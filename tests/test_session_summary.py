@@ -333,6 +333,60 @@ class TestRoutineFiltering:
             assert "Workout B" in result
 
 
+class TestTimeWindowFiltering:
+    """Tests for the time_window parameter."""
+    
+    @staticmethod
+    def _plan_with_log(clean_db, exercise_factory, workout_plan_factory, created_at):
+        exercise_name = exercise_factory(
+            "Bench Press",
+            primary_muscle_group="Chest",
+            secondary_muscle_group=None,
+            tertiary_muscle_group=None
+        )
+        plan_id = workout_plan_factory(exercise_name=exercise_name, routine="Workout A")
+        clean_db.execute_query(
+            "INSERT INTO workout_log (workout_plan_id, routine, exercise, created_at) "
+            "VALUES (?, ?, ?, ?)",
+            (plan_id, "Workout A", exercise_name, created_at),
+        )
+    
+    def test_end_date_includes_whole_day(self, app, clean_db, exercise_factory, workout_plan_factory):
+        """A log late on the end date should fall inside the window."""
+        with app.app_context():
+            self._plan_with_log(clean_db, exercise_factory, workout_plan_factory, "2024-01-31 23:30:00")
+            
+            result = calculate_session_summary(time_window=("2024-01-31", "2024-01-31"))
+            
+            assert "Chest" in result["Workout A"]
+    
+    def test_logs_outside_window_excluded(self, app, clean_db, exercise_factory, workout_plan_factory):
+        """Logs before the start date or after the end date should be dropped."""
+        with app.app_context():
+            self._plan_with_log(clean_db, exercise_factory, workout_plan_factory, "2024-01-31 23:30:00")
+            
+            assert calculate_session_summary(time_window=("2024-02-01", None)) == {}
+            assert calculate_session_summary(time_window=(None, "2024-01-30")) == {}
+
+    def test_iso_t_separator_and_offset_matched_by_date(self, app, clean_db, exercise_factory, workout_plan_factory):
+        """Timestamps with a 'T' separator or UTC offset should be windowed by their date."""
+        with app.app_context():
+            self._plan_with_log(clean_db, exercise_factory, workout_plan_factory, "2024-01-31T23:30:00+02:00")
+
+            result = calculate_session_summary(time_window=("2024-01-31", "2024-01-31"))
+
+            assert "Chest" in result["Workout A"]
+
+    def test_offset_crossing_midnight_windowed_by_utc_date(self, app, clean_db, exercise_factory, workout_plan_factory):
+        """A log whose UTC date precedes its local date should still match that UTC day."""
+        with app.app_context():
+            self._plan_with_log(clean_db, exercise_factory, workout_plan_factory, "2024-02-01T01:00:00+02:00")
+
+            result = calculate_session_summary(time_window=("2024-01-31", "2024-01-31"))
+
+            assert "Chest" in result["Workout A"]
+
+
 class TestVolumeWarnings:
     """Tests for volume warning levels."""
     
@@ -183,3 +183,16 @@ def test_weekly_summary_direct_only_mode(db_handler):
     # Secondary and tertiary muscles should NOT appear
     assert 'Triceps' not in summary
     assert 'Front-Shoulder' not in summary
+
+
+@pytest.mark.usefixtures('clean_db')
+def test_summaries_reuse_supplied_handler(db_handler, monkeypatch):
+    """Passing a handler should run every summary query on that connection."""
+    def _no_new_connections(*args, **kwargs):
+        raise AssertionError("unexpected DatabaseHandler()")
+
+    monkeypatch.setattr('utils.weekly_summary.DatabaseHandler', _no_new_connections)
+
+    assert calculate_weekly_summary(db=db_handler) == {}
+    assert calculate_exercise_categories(db_handler) == []
+    assert calculate_isolated_muscles_stats(db_handler) == []
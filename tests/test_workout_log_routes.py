@@ -306,6 +306,47 @@ class TestExportWorkoutLog:
         assert resp.status_code == 200
         assert "spreadsheetml" in resp.content_type or resp.status_code == 200
 
+    def test_export_workout_log_writes_rows(self, client, clean_db, workout_log_entry):
+        """Exported sheet should contain the query columns and logged values."""
+        from io import BytesIO
+        from openpyxl import load_workbook
+
+        resp = client.get("/export_workout_log")
+        sheet = load_workbook(BytesIO(resp.data))["Workout Log"]
+        headers = [cell.value for cell in sheet[1]]
+        assert headers[:3] == ["id", "routine", "exercise"]
+        row = dict(zip(headers, (cell.value for cell in sheet[2])))
+        assert row["exercise"] == "Bench Press"
+        assert row["planned_weight"] == 80.0
+        assert row["created_at"] is not None
+
+    def test_export_workout_log_date_formats(self, client, clean_db, workout_log_entry):
+        """DATE columns should export without a time part; created_at keeps one."""
+        from io import BytesIO
+        from openpyxl import load_workbook
+
+        clean_db.execute_query(
+            "UPDATE workout_log SET last_progression_date = ? WHERE id = ?",
+            ("2024-03-01", workout_log_entry["id"]),
+        )
+
+        resp = client.get("/export_workout_log")
+        sheet = load_workbook(BytesIO(resp.data))["Workout Log"]
+        headers = [cell.value for cell in sheet[1]]
+        cells = dict(zip(headers, sheet[2]))
+        assert cells["last_progression_date"].number_format == "yyyy-mm-dd"
+        assert cells["created_at"].number_format == "yyyy-mm-dd hh:mm:ss"
+
+    def test_export_workout_log_read_failure_returns_404(self, client, clean_db, monkeypatch):
+        """A failed read should report nothing to export, as before."""
+        def _broken_handler(*args, **kwargs):
+            raise RuntimeError("database unavailable")
+
+        monkeypatch.setattr("routes.workout_log.DatabaseHandler", _broken_handler)
+
+        resp = client.get("/export_workout_log")
+        assert resp.status_code == 404
+
 
 # Fixtures for workout_log tests
 @pytest.fixture
@@ -113,6 +113,15 @@ class TestGetWorkoutPlan:
         data = resp.get_json()
         assert len(data["data"]) >= 1
 
+    def test_table_columns_matches_column_exists(self, db_handler):
+        """table_columns should list the same columns column_exists reports."""
+        from routes.workout_plan import column_exists, table_columns
+
+        columns = table_columns(db_handler, "user_selection")
+        assert {"routine", "exercise", "sets"} <= columns
+        assert all(column_exists(db_handler, "user_selection", c) for c in columns)
+        assert not column_exists(db_handler, "user_selection", "no_such_column")
+
 
 class TestRemoveExercise:
     """Tests for POST /remove_exercise endpoint."""
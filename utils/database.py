@@ -1,10 +1,12 @@
 """Database connection helpers and lightweight data-access abstraction."""
 from __future__ import annotations
 
+import os
 import shutil
 import sqlite3
 import threading
 import time
+import weakref
 from collections.abc import Iterable, Mapping, Sequence
 from datetime import date as _date, datetime as _datetime
 from pathlib import Path
@@ -104,6 +106,155 @@ def _configure_connection(connection: sqlite3.Connection) -> sqlite3.Connection:
     return connection
 
 
+# Session-level PRAGMAs for bulk read/write passes (initialisation, maintenance).
+# journal_mode/synchronous are deliberately left to _configure_connection so the
+# development safety settings still apply.
+BULK_PRAGMAS: tuple[str, ...] = (
+    "PRAGMA temp_store = MEMORY;",
+    "PRAGMA cache_size = -131072;",  # 128 MiB page cache (negative = KiB)
+    "PRAGMA mmap_size = 268435456;",  # 256 MiB memory-mapped reads
+)
+
+
+def configure_bulk_connection(connection: sqlite3.Connection) -> sqlite3.Connection:
+    """Enlarge cache/mmap and keep temp structures in memory for bulk passes."""
+    for pragma in BULK_PRAGMAS:
+        connection.execute(pragma)
+    # The enlarged cache should not outlive the pass in the idle pool
+    _BULK_CONNECTION_IDS.add(id(connection))
+    return connection
+
+
+# Idle connections handed back by DatabaseHandler.close() for reuse. Opening
+# one costs a connect plus the PRAGMA setup above (and a WAL checkpoint on
+# close), which outweighs the queries of a typical request.
+POOL_MAX_IDLE = 8
+# Pooled connections skip the per-close checkpoint, so every this-many releases
+# one truncates the WAL instead of letting it grow until the pool is drained.
+POOL_CHECKPOINT_INTERVAL = 100
+# Re-entrant: a handler's finalizer may release its connection from a garbage
+# collection pass that runs while this thread already holds the lock.
+_POOL_LOCK = threading.RLock()
+# (database path, (st_dev, st_ino) of the file when opened, connection)
+_IDLE_CONNECTIONS: list[tuple[str, tuple[int, int], sqlite3.Connection]] = []
+# Connections given BULK_PRAGMAS; these are closed instead of pooled.
+_BULK_CONNECTION_IDS: set[int] = set()
+# Pooled connections currently held by a DatabaseHandler, per database path.
+_CHECKED_OUT: dict[str, int] = {}
+_releases_since_checkpoint = 0
+
+
+def _file_identity(db_path: str) -> Optional[tuple[int, int]]:
+    """Return (device, inode) of ``db_path``, or None when it does not exist."""
+    try:
+        stat = os.stat(db_path)
+    except OSError:
+        return None
+    return (stat.st_dev, stat.st_ino)
+
+
+def _checkpoint(connection: sqlite3.Connection) -> None:
+    """Checkpoint and truncate the WAL file (a no-op outside WAL mode)."""
+    try:
+        # This helps prevent corruption on unclean shutdowns
+        connection.execute("PRAGMA wal_checkpoint(TRUNCATE);")
+    except sqlite3.Error:
+        # Ignore errors if not in WAL mode
+        pass
+
+
+def _close_connection(connection: sqlite3.Connection) -> None:
+    """Checkpoint (when in WAL mode) and close ``connection``."""
+    _BULK_CONNECTION_IDS.discard(id(connection))
+    _checkpoint(connection)
+    connection.close()
+    logger.debug("SQLite connection closed")
+
+
+def acquire_connection(
+    database_path: Optional[str] = None,
+) -> tuple[sqlite3.Connection, Optional[tuple[int, int]]]:
+    """Return a pooled connection to ``database_path`` or open a new one.
+    
+    Idle connections whose file was deleted or replaced since they were
+    opened (recovery, restores) are closed instead of reused. Also returns
+    the file identity to pass back to release_connection().
+    """
+    db_path = str(Path(database_path or utils.config.DB_FILE))
+    identity = _file_identity(db_path)
+    reused = None
+    stale = []
+    with _POOL_LOCK:
+        for index in range(len(_IDLE_CONNECTIONS) - 1, -1, -1):
+            path, opened_identity, connection = _IDLE_CONNECTIONS[index]
+            if path != db_path:
+                continue
+            del _IDLE_CONNECTIONS[index]
+            if identity is not None and opened_identity == identity:
+                reused = connection
+                break
+            stale.append(connection)
+    for connection in stale:
+        _close_connection(connection)
+    if reused is not None:
+        connection = reused
+    else:
+        connection = get_db_connection(db_path)
+        identity = _file_identity(db_path)
+    with _POOL_LOCK:
+        _CHECKED_OUT[db_path] = _CHECKED_OUT.get(db_path, 0) + 1
+    return connection, identity
+
+
+def release_connection(
+    database_path: Optional[str],
+    identity: Optional[tuple[int, int]],
+    connection: sqlite3.Connection,
+) -> None:
+    """Hand ``connection`` back to the idle pool, or close it when it cannot be reused."""
+    global _releases_since_checkpoint
+    db_path = str(Path(database_path or utils.config.DB_FILE))
+    with _POOL_LOCK:
+        remaining = _CHECKED_OUT.get(db_path, 0) - 1
+        if remaining > 0:
+            _CHECKED_OUT[db_path] = remaining
+        else:
+            _CHECKED_OUT.pop(db_path, None)
+        _releases_since_checkpoint += 1
+        checkpoint_due = _releases_since_checkpoint >= POOL_CHECKPOINT_INTERVAL
+        if checkpoint_due:
+            _releases_since_checkpoint = 0
+    if identity is None or id(connection) in _BULK_CONNECTION_IDS:
+        _close_connection(connection)
+        return
+    try:
+        if connection.in_transaction:
+            # Uncommitted work is discarded, as closing would have done
+            connection.rollback()
+    except sqlite3.Error:
+        _close_connection(connection)
+        return
+    if checkpoint_due:
+        _checkpoint(connection)
+
+    evicted = None
+    with _POOL_LOCK:
+        _IDLE_CONNECTIONS.append((db_path, identity, connection))
+        if len(_IDLE_CONNECTIONS) > POOL_MAX_IDLE:
+            evicted = _IDLE_CONNECTIONS.pop(0)[2]
+    if evicted is not None:
+        _close_connection(evicted)
+
+
+def close_idle_connections() -> None:
+    """Close every pooled connection (shutdown, or after replacing a database file)."""
+    with _POOL_LOCK:
+        idle = [connection for _, _, connection in _IDLE_CONNECTIONS]
+        _IDLE_CONNECTIONS.clear()
+    for connection in idle:
+        _close_connection(connection)
+
+
 def _should_attempt_recovery(exc: sqlite3.DatabaseError, database_path: str) -> bool:
     """Return True when the exception indicates corruption and we have not retried yet."""
     message = str(exc).lower()
@@ -123,11 +274,25 @@ def _should_attempt_recovery(exc: sqlite3.DatabaseError, database_path: str) ->
 def _attempt_database_recovery(database_path: str) -> bool:
     """Quarantine the corrupted database file and restore a safe copy when available."""
     db_path = Path(database_path)
+    with _POOL_LOCK:
+        checked_out = _CHECKED_OUT.get(str(db_path), 0)
+    if checked_out:
+        # Open handlers still hold the file; renaming it would fail on Windows
+        # and strand them on the quarantined copy elsewhere
+        logger.error(
+            "SQLite database at %s appears corrupted, but %s connection(s) are in use; "
+            "skipping automatic recovery",
+            db_path,
+            checked_out,
+        )
+        return False
     _RECOVERY_ATTEMPTS[database_path] = True
     logger.error(
         "SQLite database at %s appears corrupted; attempting automatic recovery",
         db_path,
     )
+    # Idle pooled connections keep the file open too
+    close_idle_connections()
 
     wal_suffixes = ("-wal", "-shm")
     for suffix in wal_suffixes:
@@ -207,7 +372,14 @@ class DatabaseHandler:
     def __init__(self, database_path: Optional[str] = None) -> None:
         # Use dynamic config lookup to support test overrides
         self.database_path = database_path or utils.config.DB_FILE
-        self.connection: sqlite3.Connection = get_db_connection(self.database_path)
+        self.connection: sqlite3.Connection
+        self.connection, self._file_identity = acquire_connection(self.database_path)
+        # Returns the connection if the handler is dropped without close(),
+        # so a leaked handler does not hold its _CHECKED_OUT slot for good
+        self._release = weakref.finalize(
+            self, release_connection, self.database_path, self._file_identity, self.connection
+        )
+        self._release.atexit = False
         self.cursor: sqlite3.Cursor = self.connection.cursor()
         self._owns_lock = False
 
@@ -299,7 +471,8 @@ class DatabaseHandler:
         
         Thread-safe: Acquires a global lock for write operations.
         """
-        prepared_sets = list(self._prepare_params(params, for_many=True) for params in param_sets)
+        # Stream parameter sets straight into sqlite3 instead of building a list.
+        prepared_sets = (self._prepare_params(params, for_many=True) for params in param_sets)
         start_time = time.time()
         
         # executemany is typically a write operation
@@ -414,15 +587,9 @@ class DatabaseHandler:
     # -- Lifetime management -------------------------------------------------
     def close(self) -> None:
         if getattr(self, "connection", None):
-            try:
-                # Checkpoint WAL file before closing (if WAL mode is active)
-                # This helps prevent corruption on unclean shutdowns
-                self.connection.execute("PRAGMA wal_checkpoint(TRUNCATE);")
-            except sqlite3.Error:
-                # Ignore errors if not in WAL mode
-                pass
-            self.connection.close()
-            logger.debug("SQLite connection closed")
+            # Reset the handler's cursor so no half-read statement stays open
+            self.cursor.close()
+            self._release()
             self.connection = None  # type: ignore[assignment]
             self.cursor = None  # type: ignore[assignment]
 
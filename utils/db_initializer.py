@@ -6,15 +6,36 @@ import sqlite3
 import threading
 from pathlib import Path
 
-from utils.database import DatabaseHandler, _DB_LOCK
+from utils.database import DatabaseHandler, _DB_LOCK, configure_bulk_connection
+from utils.filter_cache import invalidate_cache
 from utils.logger import get_logger
-from utils.normalization import normalize_equipment, normalize_muscle
+from utils.normalization import (
+    CANONICAL_MUSCLE_LABELS,
+    normalize_equipment,
+    normalize_muscle,
+)
 
 logger = get_logger()
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 SEED_DB_PATH = REPO_ROOT / "data" / "Database_backup" / "database.db"
 MIN_EXERCISE_ROWS = 100
+# Rows fetched (and written back) per batch while populating movement patterns.
+PATTERN_BATCH_ROWS = 1000
+# Exercise columns given a single-column index for the filter dropdowns.
+LOOKUP_INDEX_COLUMNS = (
+    "primary_muscle_group",
+    "secondary_muscle_group",
+    "tertiary_muscle_group",
+)
+# Enumerated exercise columns filtered with `column = ? COLLATE NOCASE`.
+MATCH_INDEX_COLUMNS = (
+    "force",
+    "equipment",
+    "mechanic",
+    "utility",
+    "difficulty",
+)
 
 # Guard against double initialization during Flask auto-reload
 _INITIALIZATION_LOCK = threading.Lock()
@@ -22,14 +43,14 @@ _INITIALIZATION_COMPLETE = False
 
 
 def _initialize_exercises_table(db: DatabaseHandler) -> None:
-    existing = db.fetch_all(
-        "SELECT name FROM sqlite_master WHERE type='table' AND name='exercises'"
-    )
-    if existing:
-        cols = db.fetch_all("PRAGMA table_info(exercises)")
+    # One table_info read answers existence, primary key and column checks;
+    # it returns no rows when the table does not exist yet.
+    cols = db.fetch_all("PRAGMA table_info(exercises)")
+    if cols:
         pk_column = next((row['name'] for row in cols if row.get('pk') == 1), None)
         if pk_column != 'exercise_name':
             db.execute_query("DROP TABLE IF EXISTS exercises")
+            cols = []
 
     db.execute_query(
         """
@@ -53,12 +74,12 @@ def _initialize_exercises_table(db: DatabaseHandler) -> None:
         """
     )
     
-    # Add movement pattern columns if they don't exist (for existing databases)
-    cols = db.fetch_all("PRAGMA table_info(exercises)")
+    # Add movement pattern columns if they don't exist (for existing databases);
+    # a freshly created table already has them.
     col_names = {row['name'] for row in cols}
-    if 'movement_pattern' not in col_names:
+    if cols and 'movement_pattern' not in col_names:
         db.execute_query("ALTER TABLE exercises ADD COLUMN movement_pattern TEXT")
-    if 'movement_subpattern' not in col_names:
+    if cols and 'movement_subpattern' not in col_names:
         db.execute_query("ALTER TABLE exercises ADD COLUMN movement_subpattern TEXT")
     db.execute_query(
         """
@@ -66,16 +87,25 @@ def _initialize_exercises_table(db: DatabaseHandler) -> None:
         ON exercises(exercise_name COLLATE NOCASE)
         """
     )
+    # Dropdown columns read by /get_unique_values: the index lets
+    # SELECT DISTINCT ... ORDER BY walk the column without a temp B-tree.
+    for column in LOOKUP_INDEX_COLUMNS:
+        db.execute_query(
+            f"CREATE INDEX IF NOT EXISTS idx_exercises_{column} ON exercises({column})"
+        )
+    # Case-insensitive equality filters can only seek a NOCASE index.
+    for column in MATCH_INDEX_COLUMNS:
+        db.execute_query(
+            f"CREATE INDEX IF NOT EXISTS idx_exercises_{column}_nocase "
+            f"ON exercises({column} COLLATE NOCASE)"
+        )
 
 
 def _initialize_isolated_muscles_table(db: DatabaseHandler) -> None:
-    existing = db.fetch_all(
-        "SELECT name FROM sqlite_master WHERE type='table' AND name='exercise_isolated_muscles'"
-    )
-    if existing:
-        columns = {
-            row['name'] for row in db.fetch_all("PRAGMA table_info(exercise_isolated_muscles)")
-        }
+    columns = {
+        row['name'] for row in db.fetch_all("PRAGMA table_info(exercise_isolated_muscles)")
+    }
+    if columns:
         fk_info = db.fetch_all("PRAGMA foreign_key_list(exercise_isolated_muscles)")
         expected_columns = {'exercise_name', 'muscle'}
         fk_valid = bool(
@@ -258,6 +288,32 @@ def _initialize_workout_log_table(db: DatabaseHandler) -> None:
         )
         """
     )
+    # Export/summary queries join workout_log to exercises by name and read it
+    # newest-first (ORDER BY created_at DESC LIMIT ...) or by recent date range.
+    db.execute_query(
+        """
+        CREATE INDEX IF NOT EXISTS idx_workout_log_exercise
+        ON workout_log(exercise)
+        """
+    )
+    db.execute_query(
+        """
+        CREATE INDEX IF NOT EXISTS idx_workout_log_created_at
+        ON workout_log(created_at)
+        """
+    )
+    # Superseded DATE(created_at) expression index: date windows now seek
+    # idx_workout_log_created_at with a widened raw range instead
+    db.execute_query("DROP INDEX IF EXISTS idx_workout_log_created_date")
+    # Scored-only newest-first reads (streamed session summary) skip unscored
+    # rows entirely; the WHERE must match the query's predicate to be used.
+    db.execute_query(
+        """
+        CREATE INDEX IF NOT EXISTS idx_workout_log_scored_created_at
+        ON workout_log(created_at)
+        WHERE scored_weight IS NOT NULL OR scored_max_reps IS NOT NULL
+        """
+    )
 
 
 def _seed_exercises_from_backup_if_needed(db: DatabaseHandler) -> None:
@@ -327,10 +383,14 @@ def _seed_exercises_from_backup_if_needed(db: DatabaseHandler) -> None:
                 logger.exception("Failed to detach seed database after seeding attempt")
 
     try:
-        row = db.fetch_one("SELECT COUNT(*) AS count FROM exercises")
-        final_count = int(row["count"]) if row and row.get("count") is not None else existing_count
-        isolated_row = db.fetch_one("SELECT COUNT(*) AS count FROM exercise_isolated_muscles")
-        isolated_count = int(isolated_row["count"]) if isolated_row and isolated_row.get("count") is not None else 0
+        row = db.fetch_one(
+            "SELECT (SELECT COUNT(*) FROM exercises) AS exercise_count, "
+            "(SELECT COUNT(*) FROM exercise_isolated_muscles) AS isolated_count"
+        ) or {}
+        final_count = (
+            int(row["exercise_count"]) if row.get("exercise_count") is not None else existing_count
+        )
+        isolated_count = int(row["isolated_count"]) if row.get("isolated_count") is not None else 0
         logger.info(
             "Exercises catalogue now holds %s rows (%s isolated muscle mappings)",
             final_count,
@@ -370,6 +430,7 @@ def _normalize_equipment_values(db: DatabaseHandler) -> None:
             db.execute_query(
                 "UPDATE exercises SET equipment = ? WHERE equipment = ?",
                 (normalised, original),
+                commit=False,
             )
             changes += 1
         except sqlite3.Error:
@@ -380,51 +441,82 @@ def _normalize_equipment_values(db: DatabaseHandler) -> None:
 
 
 def _normalize_muscle_group_values(db: DatabaseHandler) -> None:
-    """Standardise muscle group columns to canonical casing and aliases."""
+    """Standardise muscle group columns to canonical casing and aliases.
+
+    Each distinct label is normalised once in Python; the resulting
+    source -> canonical pairs are loaded into a temp table and applied to every
+    column with a single UPDATE, so no exercise row round-trips to Python.
+    """
     muscle_columns = (
         "primary_muscle_group",
         "secondary_muscle_group",
         "tertiary_muscle_group",
     )
 
-    for column in muscle_columns:
-        try:
-            rows = db.fetch_all(
-                f"SELECT exercise_name, {column} FROM exercises "
-                f"WHERE {column} IS NOT NULL AND TRIM({column}) <> ''"
-            )
-        except sqlite3.Error:
-            logger.exception("Failed to read values for column '%s'", column)
-            continue
+    # Labels that are already canonical are filtered out in SQL so only dirty
+    # values ever reach the Python normaliser.
+    canonical_labels = sorted(CANONICAL_MUSCLE_LABELS)
+    canonical_placeholders = ", ".join("?" for _ in canonical_labels)
+    distinct_query = " UNION ".join(
+        f"SELECT {column} AS value FROM exercises "
+        f"WHERE {column} IS NOT NULL AND TRIM({column}) <> '' "
+        f"AND {column} NOT IN ({canonical_placeholders})"
+        for column in muscle_columns
+    )
+    try:
+        rows = db.fetch_all(distinct_query, canonical_labels * len(muscle_columns))
+    except sqlite3.Error:
+        logger.exception("Failed to read distinct muscle group values")
+        return
 
-        if not rows:
+    canon_pairs = []
+    for row in rows:
+        original = row.get("value")
+        normalised = normalize_muscle(original)
+        if normalised is None or normalised == original:
             continue
+        canon_pairs.append((original, normalised))
 
-        updates = 0
-        for row in rows:
-            original = row.get(column)
-            if not original:
-                continue
-
-            normalised = normalize_muscle(original)
-            if normalised is None or normalised == original:
-                continue
+    if not canon_pairs:
+        return
 
-            try:
-                db.execute_query(
-                    f"UPDATE exercises SET {column} = ? WHERE exercise_name = ?",
-                    (normalised, row.get("exercise_name")),
-                )
-                updates += 1
-            except sqlite3.Error:
-                logger.exception(
-                    "Failed to normalise %s value '%s' -> '%s' for exercise '%s'",
-                    column,
-                    original,
-                    normalised,
-                    row.get("exercise_name"),
-                )
+    # Stage and apply the synonyms under one savepoint: a failure rolls this
+    # pass back as a unit without aborting the initializer's outer transaction.
+    column_updates: list[tuple[str, int]] = []
+    try:
+        db.execute_query("SAVEPOINT muscle_normalization", commit=False)
+    except sqlite3.Error:
+        logger.exception("Failed to open savepoint for muscle group normalization")
+        return
+    try:
+        db.execute_query(
+            "CREATE TEMP TABLE IF NOT EXISTS muscle_canon "
+            "(src TEXT PRIMARY KEY, dst TEXT NOT NULL)",
+            commit=False,
+        )
+        db.execute_query("DELETE FROM muscle_canon", commit=False)
+        db.executemany(
+            "INSERT INTO muscle_canon (src, dst) VALUES (?, ?)",
+            canon_pairs,
+            commit=False,
+        )
+        for column in muscle_columns:
+            updates = db.execute_query(
+                f"UPDATE exercises SET {column} = "
+                f"(SELECT dst FROM muscle_canon WHERE src = exercises.{column}) "
+                f"WHERE {column} IN (SELECT src FROM muscle_canon)",
+                commit=False,
+            )
+            column_updates.append((column, updates))
+        db.execute_query("DROP TABLE IF EXISTS temp.muscle_canon", commit=False)
+        db.execute_query("RELEASE muscle_normalization", commit=False)
+    except sqlite3.Error:
+        logger.exception("Failed to normalise muscle group values")
+        db.execute_query("ROLLBACK TO muscle_normalization", commit=False)
+        db.execute_query("RELEASE muscle_normalization", commit=False)
+        return
 
+    for column, updates in column_updates:
         if updates:
             logger.info(
                 "Normalised %s %s value%s",
@@ -459,15 +551,26 @@ def initialize_database(force: bool = False) -> None:
         logger.info("Starting database initialization...")
         
         with DatabaseHandler() as db:
+            configure_bulk_connection(db.connection)
             _initialize_exercises_table(db)
             _initialize_isolated_muscles_table(db)
             _initialize_user_selection_table(db)
             _initialize_workout_log_table(db)
             _seed_exercises_from_backup_if_needed(db)
+            # The normalisation passes defer their commits so every per-row
+            # UPDATE lands in one transaction instead of one fsync each.
             _normalize_equipment_values(db)
             _normalize_muscle_group_values(db)
             _populate_movement_patterns(db)
+            db.connection.commit()
+            # Refresh planner statistics (ANALYZE) only for tables that need it
+            try:
+                db.execute_query("PRAGMA optimize")
+            except sqlite3.Error:
+                logger.exception("PRAGMA optimize failed after initialization")
         
+        # Seeding and normalisation may have rewritten the catalogue
+        invalidate_cache('exercises')
         _INITIALIZATION_COMPLETE = True
         logger.info("Database initialization complete")
 
@@ -480,8 +583,15 @@ def _populate_movement_patterns(db: DatabaseHandler) -> None:
         logger.warning("movement_patterns module not available, skipping pattern population")
         return
     
+    # Stream candidates in arraysize batches rather than materialising the
+    # whole catalogue. Updates are collected and written only after the scan's
+    # cursor is closed: SQLite leaves modifying a table mid-scan undefined, and
+    # these updates remove rows from the scan's own WHERE.
+    cursor = db.connection.cursor()
+    cursor.row_factory = None  # plain tuples; columns are unpacked positionally
+    cursor.arraysize = PATTERN_BATCH_ROWS
     try:
-        rows = db.fetch_all(
+        cursor.execute(
             """
             SELECT exercise_name, primary_muscle_group, mechanic 
             FROM exercises 
@@ -490,40 +600,56 @@ def _populate_movement_patterns(db: DatabaseHandler) -> None:
         )
     except sqlite3.Error:
         logger.exception("Failed to query exercises for pattern population")
+        cursor.close()
         return
     
-    if not rows:
-        logger.debug("All exercises already have movement patterns assigned")
-        return
-    
-    updates = 0
-    for row in rows:
-        exercise_name = row.get("exercise_name")
-        if not exercise_name:
-            continue
-        
-        pattern, subpattern = classify_exercise(
-            exercise_name,
-            row.get("primary_muscle_group"),
-            row.get("mechanic"),
-        )
-        
-        if pattern:
-            try:
-                db.execute_query(
-                    """
-                    UPDATE exercises 
-                    SET movement_pattern = ?, movement_subpattern = ?
-                    WHERE exercise_name = ?
-                    """,
-                    (pattern.value, subpattern.value if subpattern else None, exercise_name),
-                )
-                updates += 1
-            except sqlite3.Error:
-                logger.exception(
-                    "Failed to update movement pattern for exercise '%s'",
+    scanned = 0
+    pending = []
+    try:
+        while True:
+            rows = cursor.fetchmany()
+            if not rows:
+                break
+            scanned += len(rows)
+
+            for exercise_name, primary_muscle_group, mechanic in rows:
+                if not exercise_name:
+                    continue
+
+                pattern, subpattern = classify_exercise(
                     exercise_name,
+                    primary_muscle_group,
+                    mechanic,
                 )
+                if pattern:
+                    pending.append(
+                        (pattern.value, subpattern.value if subpattern else None, exercise_name)
+                    )
+    finally:
+        cursor.close()
+
+    updates = 0
+    if pending:
+        try:
+            db.executemany(
+                """
+                UPDATE exercises 
+                SET movement_pattern = ?, movement_subpattern = ?
+                WHERE exercise_name = ?
+                """,
+                pending,
+                commit=False,
+            )
+            updates = len(pending)
+        except sqlite3.Error:
+            logger.exception(
+                "Failed to update movement patterns for %s exercise(s)",
+                len(pending),
+            )
+
+    if not scanned:
+        logger.debug("All exercises already have movement patterns assigned")
+        return
     
     if updates:
         logger.info(
@@ -1,6 +1,7 @@
 from typing import Any, Dict, Optional
 
 from utils.database import DatabaseHandler
+from utils.filter_cache import invalidate_cache
 from utils.filter_predicates import FilterPredicates
 from utils.logger import get_logger
 from utils.normalization import normalize_exercise_row, split_csv
@@ -121,6 +122,7 @@ class ExerciseManager:
                 normalised,
             )
             ExerciseManager._sync_isolated_muscles(db, exercise_name, normalised.get("advanced_isolated_muscles"))
+        invalidate_cache('exercises')
 
         return normalised
 
@@ -131,6 +133,7 @@ class ExerciseManager:
             db.execute_query("DELETE FROM exercise_isolated_muscles WHERE exercise_name = ?", (exercise_name,))
             db.execute_query("DELETE FROM exercises WHERE exercise_name = ?", (exercise_name,))
             logger.debug("Removed exercise '%s'", exercise_name)
+        invalidate_cache('exercises')
 
     @staticmethod
     def fetch_unique_values(table: str, column: str):
@@ -10,11 +10,15 @@ Provides:
 
 import re
 import os
+import math
+import sqlite3
 import tempfile
-from io import BytesIO
-from typing import List, Dict, Any, Generator, Optional
+import zipfile
+from itertools import chain
+from typing import List, Dict, Any, Generator, Iterable, Optional, Union
+from xml.sax.saxutils import escape, quoteattr
 from datetime import datetime
-from flask import Response, make_response
+from flask import Response, send_file
 from werkzeug.utils import secure_filename
 import logging
 from utils.config import MAX_EXPORT_ROWS, EXPORT_BATCH_SIZE, MAX_FILENAME_LENGTH, STREAMING_THRESHOLD
@@ -24,6 +28,9 @@ from utils.logger import get_logger
 
 logger = get_logger()
 
+# Read size used when streaming a finished workbook to the client
+FILE_CHUNK_SIZE = 64 * 1024
+
 
 def sanitize_filename(filename: str, max_length: int = None) -> str:
     """
@@ -104,19 +111,155 @@ def create_content_disposition_header(filename: str, attachment: bool = True) ->
     return header
 
 
+# Package parts of the minimal workbook written by _write_plain_workbook
+_XML_DECLARATION = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+_SPREADSHEET_NS = 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'
+_RELATIONSHIPS_NS = 'http://schemas.openxmlformats.org/package/2006/relationships'
+_OFFICE_REL = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+
+# Control characters that are not allowed anywhere in an XML document
+_ILLEGAL_XML_CHARS = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+
+def _sheet_row_xml(row_number: int, values, columns: List[str]) -> str:
+    """Render one worksheet row; bools and numbers as typed cells, the rest as inline strings."""
+    cells = []
+    for column, value in zip(columns, values):
+        if value is None:
+            continue
+        value_type = type(value)
+        if value_type is bool:
+            cells.append(f'<c r="{column}{row_number}" t="b"><v>{int(value)}</v></c>')
+        elif value_type is int or (value_type is float and math.isfinite(value)):
+            cells.append(f'<c r="{column}{row_number}"><v>{value!r}</v></c>')
+        else:
+            text = escape(_ILLEGAL_XML_CHARS.sub('', str(value)))
+            cells.append(
+                f'<c r="{column}{row_number}" t="inlineStr">'
+                f'<is><t xml:space="preserve">{text}</t></is></c>'
+            )
+    return f'<row r="{row_number}">{"".join(cells)}</row>'
+
+
+def _write_plain_workbook(
+    path: str,
+    sheets: Iterable[tuple[str, Union[List[Dict[str, Any]], sqlite3.Cursor]]]
+) -> int:
+    """
+    Write unformatted sheets straight to an .xlsx package.
+    
+    Each worksheet's XML is rendered from the rows and streamed into its zip
+    entry, skipping the per-cell bookkeeping of a workbook library. Rows are
+    buffered only in batches of EXPORT_BATCH_SIZE.
+    
+    Args:
+        path: Destination file path
+        sheets: (sheet_name, data) pairs, where data is a list of row
+            dictionaries or an open sqlite3 cursor
+        
+    Returns:
+        Number of worksheets written
+    """
+    from xlsxwriter.utility import xl_col_to_name
+    
+    sheet_names = []
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as package:
+        for sheet_name, data in sheets:
+            if isinstance(data, sqlite3.Cursor):
+                first_row = data.fetchone()
+                if first_row is None:
+                    logger.info(f"Skipping empty sheet: {sheet_name}")
+                    continue
+                headers = [column[0] for column in data.description]
+                rows = chain((first_row,), data)
+            elif data:
+                headers = list(data[0].keys())
+                rows = ([row_data.get(key, '') for key in headers] for row_data in data)
+            else:
+                logger.warning(f"Empty data for sheet: {sheet_name}")
+                continue
+            
+            sheet_names.append(sheet_name[:31])  # Excel sheet name limit
+            columns = [xl_col_to_name(index) for index in range(len(headers))]
+            entry = f'xl/worksheets/sheet{len(sheet_names)}.xml'
+            with package.open(entry, 'w', force_zip64=True) as sheet:
+                sheet.write(f'{_XML_DECLARATION}<worksheet xmlns="{_SPREADSHEET_NS}"><sheetData>'.encode())
+                sheet.write(_sheet_row_xml(1, headers, columns).encode())
+                batch = []
+                for row_number, row in enumerate(rows, start=2):
+                    if row_number > MAX_EXPORT_ROWS + 1:
+                        logger.warning(f"Reached max export rows ({MAX_EXPORT_ROWS})")
+                        break
+                    batch.append(_sheet_row_xml(row_number, row, columns))
+                    if len(batch) >= EXPORT_BATCH_SIZE:
+                        sheet.write(''.join(batch).encode())
+                        batch.clear()
+                sheet.write(''.join(batch).encode())
+                sheet.write(b'</sheetData></worksheet>')
+        
+        if not sheet_names:
+            # A workbook must contain at least one worksheet
+            sheet_names.append('Sheet1')
+            package.writestr(
+                'xl/worksheets/sheet1.xml',
+                f'{_XML_DECLARATION}<worksheet xmlns="{_SPREADSHEET_NS}"><sheetData/></worksheet>'
+            )
+        
+        numbers = range(1, len(sheet_names) + 1)
+        package.writestr('[Content_Types].xml', (
+            f'{_XML_DECLARATION}<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+            '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+            '<Default Extension="xml" ContentType="application/xml"/>'
+            '<Override PartName="/xl/workbook.xml" '
+            'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+            + ''.join(
+                f'<Override PartName="/xl/worksheets/sheet{n}.xml" '
+                'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+                for n in numbers
+            )
+            + '</Types>'
+        ))
+        package.writestr('_rels/.rels', (
+            f'{_XML_DECLARATION}<Relationships xmlns="{_RELATIONSHIPS_NS}">'
+            f'<Relationship Id="rId1" Type="{_OFFICE_REL}/officeDocument" Target="xl/workbook.xml"/>'
+            '</Relationships>'
+        ))
+        package.writestr('xl/workbook.xml', (
+            f'{_XML_DECLARATION}<workbook xmlns="{_SPREADSHEET_NS}" xmlns:r="{_OFFICE_REL}"><sheets>'
+            + ''.join(
+                f'<sheet name={quoteattr(name)} sheetId="{n}" r:id="rId{n}"/>'
+                for n, name in zip(numbers, sheet_names)
+            )
+            + '</sheets></workbook>'
+        ))
+        package.writestr('xl/_rels/workbook.xml.rels', (
+            f'{_XML_DECLARATION}<Relationships xmlns="{_RELATIONSHIPS_NS}">'
+            + ''.join(
+                f'<Relationship Id="rId{n}" Type="{_OFFICE_REL}/worksheet" '
+                f'Target="worksheets/sheet{n}.xml"/>'
+                for n in numbers
+            )
+            + '</Relationships>'
+        ))
+    
+    return len(sheet_names)
+
+
 def stream_excel_response(
-    workbook_generator: Generator[tuple[str, List[Dict[str, Any]]], None, None],
+    workbook_generator: Generator[tuple[str, Union[List[Dict[str, Any]], sqlite3.Cursor]], None, None],
     filename: str,
     chunk_size: int = 8192
 ) -> Response:
     """
     Create a streaming response for Excel file generation.
     
-    This generates the Excel file on-the-fly, reducing memory usage
-    for large exports.
+    The sheets are unformatted, so the worksheet XML is written directly
+    into a temporary .xlsx file by _write_plain_workbook, and the finished
+    file is then streamed back in chunks.
     
     Args:
-        workbook_generator: Generator yielding (sheet_name, data) tuples
+        workbook_generator: Generator yielding (sheet_name, data) tuples, where
+            data is a list of row dictionaries or an open sqlite3 cursor
         filename: Output filename
         chunk_size: Size of chunks to stream (bytes)
         
@@ -124,50 +267,21 @@ def stream_excel_response(
         Flask Response object with streaming content
     """
     def generate():
-        # Lazy load xlsxwriter - only imported when export is requested
-        from xlsxwriter import Workbook
-        
-        output = BytesIO()
-        workbook = Workbook(output, {'in_memory': True})
+        temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.xlsx')
+        temp_file_path = temp_file.name
+        temp_file.close()
         
         try:
-            for sheet_name, data in workbook_generator:
-                if not data:
-                    logger.warning(f"Empty data for sheet: {sheet_name}")
-                    continue
-                
-                worksheet = workbook.add_worksheet(sheet_name[:31])  # Excel sheet name limit
-                
-                # Write headers
-                headers = list(data[0].keys()) if data else []
-                for col_idx, header in enumerate(headers):
-                    worksheet.write(0, col_idx, header)
-                
-                # Write data in batches
-                for row_idx, row_data in enumerate(data, start=1):
-                    if row_idx > MAX_EXPORT_ROWS:
-                        logger.warning(f"Reached max export rows ({MAX_EXPORT_ROWS})")
-                        break
-                    
-                    for col_idx, key in enumerate(headers):
-                        value = row_data.get(key, '')
-                        worksheet.write(row_idx, col_idx, value)
-            
-            workbook.close()
-            output.seek(0)
+            _write_plain_workbook(temp_file_path, workbook_generator)
             
             # Stream the content
-            while True:
-                chunk = output.read(chunk_size)
-                if not chunk:
-                    break
-                yield chunk
+            yield from _iter_file_chunks(temp_file_path, chunk_size)
                 
         except Exception as e:
             logger.exception(f"Error generating Excel file: {e}")
             raise
         finally:
-            output.close()
+            _remove_temp_file(temp_file_path)
     
     response = Response(
         generate(),
@@ -181,17 +295,50 @@ def stream_excel_response(
     return response
 
 
+def _write_cursor_sheet(workbook, sheet_name: str, cursor: sqlite3.Cursor, header_format, cell_format) -> bool:
+    """
+    Write a sheet straight from a live query cursor, one row at a time.
+
+    Returns:
+        True if a worksheet was added, False if the cursor had no rows
+    """
+    first_row = cursor.fetchone()
+    if first_row is None:
+        logger.info(f"Skipping empty sheet: {sheet_name}")
+        return False
+
+    headers = [column[0] for column in cursor.description]
+    worksheet = workbook.add_worksheet(sheet_name[:31])
+    for col_idx, header in enumerate(headers):
+        worksheet.set_column(col_idx, col_idx, max(len(str(header)) + 2, 10))
+    worksheet.write_row(0, 0, headers, header_format)
+
+    rows_written = 0
+    for row_idx, row in enumerate(chain((first_row,), cursor), start=1):
+        if rows_written >= MAX_EXPORT_ROWS:
+            logger.warning(f"Reached max export rows ({MAX_EXPORT_ROWS}) for sheet {sheet_name}")
+            break
+        worksheet.write_row(row_idx, 0, row, cell_format)
+        rows_written += 1
+
+    logger.debug(f"Streamed {rows_written} rows to worksheet: {sheet_name[:31]}")
+    return True
+
+
 def create_excel_workbook(
-    sheets_data: Dict[str, List[Dict[str, Any]]],
+    sheets_data: Dict[str, Union[List[Dict[str, Any]], sqlite3.Cursor]],
     filename: str
 ) -> Response:
     """
     Create an Excel workbook from multiple sheets of data.
     
     Memory-efficient implementation using XlsxWriter directly without pandas.
+    The workbook is written in ``constant_memory`` mode, so each row is flushed
+    to disk as soon as the next one starts.
     
     Args:
-        sheets_data: Dictionary mapping sheet names to list of row dictionaries
+        sheets_data: Dictionary mapping sheet names to either a list of row
+            dictionaries or an open sqlite3 cursor, which is streamed row by row
         filename: Output filename
         
     Returns:
@@ -217,7 +364,7 @@ def create_excel_workbook(
         from xlsxwriter import Workbook
         
         # Write to temporary file instead of BytesIO - this is more reliable
-        workbook = Workbook(temp_file_path)
+        workbook = Workbook(temp_file_path, {'constant_memory': True})
         worksheets_created = 0
         
         # Define some formats for better readability
@@ -265,6 +412,10 @@ def create_excel_workbook(
             if data is None:
                 logger.info(f"Skipping None sheet: {sheet_name}")
                 continue
+            if isinstance(data, sqlite3.Cursor):
+                if _write_cursor_sheet(workbook, sheet_name, data, header_format, cell_format):
+                    worksheets_created += 1
+                continue
             if not isinstance(data, list):
                 logger.warning(f"Sheet {sheet_name} has invalid data type: {type(data)}")
                 continue
@@ -356,32 +507,26 @@ def create_excel_workbook(
             logger.error(f"Temporary file is empty (0 bytes): {temp_file_path}")
             raise ValueError("Failed to generate Excel file: file is empty")
         
-        # Read the file content from the temporary file
-        # This ensures we have the complete, valid Excel file
-        with open(temp_file_path, 'rb') as f:
-            file_content = f.read()
-        
-        # Validate that we have actual content
-        if not file_content:
-            logger.error("Generated Excel file is None")
-            raise ValueError("Failed to generate Excel file: file content is None")
-        if len(file_content) == 0:
-            logger.error("Generated Excel file is empty (0 bytes) after reading from file")
-            raise ValueError("Failed to generate Excel file: file content is empty")
-        
-        logger.info(f"Successfully generated Excel file: {len(file_content)} bytes (file_size={file_size})")
-        
-        # Create response with the file content as bytes
-        # Use make_response to ensure proper handling
-        response = make_response(file_content)
-        response.mimetype = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+        logger.info(f"Successfully generated Excel file: {file_size} bytes")
+        
+        # Hand the finished file to send_file so the WSGI server's file_wrapper
+        # (sendfile where available) serves it; the temporary file is removed
+        # once the response has been sent and its handle closed
+        response = send_file(
+            temp_file_path,
+            mimetype='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+            as_attachment=True,
+            download_name=sanitize_filename(filename),
+            conditional=True,
+            etag=False,
+        )
+        response.call_on_close(lambda: _remove_temp_file(temp_file_path))
         response.headers['Content-Disposition'] = create_content_disposition_header(filename)
-        response.headers['Content-Length'] = str(len(file_content))
         response.headers['Cache-Control'] = 'no-cache, no-store, must-revalidate'
         response.headers['Pragma'] = 'no-cache'
         response.headers['Expires'] = '0'
         
-        logger.debug(f"Response created with Content-Length: {len(file_content)} bytes")
+        logger.debug(f"Response created with Content-Length: {file_size} bytes")
         
         return response
         
@@ -393,19 +538,25 @@ def create_excel_workbook(
                 workbook.close()
         except Exception as close_error:
             logger.warning(f"Error closing workbook: {close_error}")
+        _remove_temp_file(temp_file_path)
         raise
-    finally:
-        # Clean up the temporary file after a delay to allow debugging if needed
-        # In case of errors, the temp file can be inspected
-        try:
-            if os.path.exists(temp_file_path):
-                # Keep temp file for a few seconds to allow inspection if debugging
-                import time
-                time.sleep(0.5)  # Small delay for debugging
-                os.remove(temp_file_path)
-                logger.debug(f"Cleaned up temporary file: {temp_file_path}")
-        except Exception as e:
-            logger.warning(f"Failed to remove temporary file {temp_file_path}: {e}")
+
+
+def _iter_file_chunks(path: str, chunk_size: int = FILE_CHUNK_SIZE) -> Generator[bytes, None, None]:
+    """Yield a file's contents in fixed-size chunks."""
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            yield chunk
+
+
+def _remove_temp_file(path: str) -> None:
+    """Delete a temporary export file, logging rather than raising on failure."""
+    try:
+        if os.path.exists(path):
+            os.remove(path)
+            logger.debug(f"Cleaned up temporary file: {path}")
+    except Exception as e:
+        logger.warning(f"Failed to remove temporary file {path}: {e}")
 
 
 def batch_query_results(
@@ -89,6 +89,20 @@ def get_cached_unique_values(table, column):
         _filter_cache.set(table, column, values)
         return values
 
+def get_or_compute(table, key, compute):
+    """Return the cached result for ``table``/``key``, running ``compute()`` on a miss.
+
+    Empty results are not cached, so a query that failed and returned ``[]``
+    is retried on the next request.
+    """
+    cached = _filter_cache.get(table, key)
+    if cached is not None:
+        return cached
+    values = compute()
+    if values:
+        _filter_cache.set(table, key, values)
+    return values
+
 def invalidate_cache(table=None, column=None):
     _filter_cache.invalidate(table, column)
 
@@ -4,8 +4,11 @@ Single source of truth for all exercise filtering logic.
 """
 
 from utils.database import DatabaseHandler
+from utils.logger import get_logger
 from typing import Dict, List, Optional, Tuple
 
+logger = get_logger()
+
 
 class FilterPredicates:
     """
@@ -41,6 +44,20 @@ class FilterPredicates:
         "synergists"
     }
     
+    @staticmethod
+    def isolated_muscle_condition(pattern_count: int = 1) -> str:
+        """
+        Build the isolated-muscle condition for ``pattern_count`` LIKE patterns.
+        
+        The mapping table is searched once, uncorrelated, and the patterns are
+        OR'd inside it, instead of probing it with one EXISTS per exercise row.
+        """
+        likes = " OR ".join(["m.muscle LIKE ?"] * pattern_count)
+        return (
+            "exercise_name IN ("
+            f"SELECT m.exercise_name FROM exercise_isolated_muscles m WHERE {likes})"
+        )
+    
     @classmethod
     def build_filter_query(
         cls, 
@@ -66,7 +83,9 @@ class FilterPredicates:
         
         conditions = []
         
-        for field, value in filters.items():
+        # Sorted fields give one SQL text per filter set, so the statement
+        # cached on the connection is reused
+        for field, value in sorted(filters.items()):
             # Validate field
             if field not in cls.VALID_FILTER_FIELDS:
                 continue
@@ -76,21 +95,14 @@ class FilterPredicates:
             
             # Special handling for advanced_isolated_muscles - use mapping table
             if field == "advanced_isolated_muscles":
-                conditions.append("""
-                    EXISTS (
-                        SELECT 1
-                        FROM exercise_isolated_muscles m
-                        WHERE m.exercise_name = exercises.exercise_name
-                          AND m.muscle LIKE ?
-                    )
-                """)
+                conditions.append(cls.isolated_muscle_condition())
                 params.append(f"%{value}%")
             # Use LIKE for partial matching fields, exact match for others
             elif field in cls.PARTIAL_MATCH_FIELDS:
                 conditions.append(f"{field} LIKE ?")
                 params.append(f"%{value}%")
             else:
-                conditions.append(f"LOWER({field}) = LOWER(?)")
+                conditions.append(f"{field} = ? COLLATE NOCASE")
                 params.append(value)
         
         if conditions:
@@ -122,8 +134,8 @@ class FilterPredicates:
                 elif results and isinstance(results[0], dict):
                     return [row["exercise_name"] for row in results if row.get("exercise_name")]
                 return []
-        except Exception as e:
-            print(f"Error filtering exercises: {e}")
+        except Exception:
+            logger.exception("Error filtering exercises")
             return []
     
     @classmethod
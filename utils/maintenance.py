@@ -3,13 +3,15 @@ from __future__ import annotations
 
 import sqlite3
 import time
-from typing import Iterable, List, Optional, Tuple
+from typing import Dict, Iterable, Optional
 
 try:  # Prefer package-relative imports when available
-    from utils.database import DatabaseHandler
+    from utils.database import DatabaseHandler, configure_bulk_connection
+    from utils.filter_cache import invalidate_cache
     from utils.normalization import normalize_advanced_muscles
 except ImportError:  # pragma: no cover - fallback for direct invocation
-    from database import DatabaseHandler  # type: ignore
+    from database import DatabaseHandler, configure_bulk_connection  # type: ignore
+    from filter_cache import invalidate_cache  # type: ignore
     from normalization import normalize_advanced_muscles  # type: ignore
 
 
@@ -80,28 +82,40 @@ def _exec_many(db: DatabaseHandler, statements: Iterable[str]) -> None:
 
 
 def _normalize_existing_rows(db: DatabaseHandler) -> None:
-    """Apply canonical advanced muscle normalization across exercises."""
-    rows = db.fetch_all(
-        "SELECT rowid AS rid, advanced_isolated_muscles FROM exercises"
-    )
-    updates: List[Tuple[Optional[str], int]] = []
-    for row in rows:
-        raw_value = row.get("advanced_isolated_muscles")
+    """Apply canonical advanced muscle normalization across exercises.
+
+    The normaliser is registered as a deterministic SQLite function so the
+    comparison and the rewrite both run inside a single UPDATE statement.
+    """
+    # Many exercises share the same muscle list, so normalise each distinct
+    # raw value once and reuse the joined result.
+    formatted_cache: Dict[Optional[str], Optional[str]] = {}
+
+    def _format_advanced(raw_value: Optional[str]) -> Optional[str]:
+        if raw_value in formatted_cache:
+            return formatted_cache[raw_value]
         tokens = normalize_advanced_muscles(raw_value)
         formatted = ", ".join(tokens) if tokens else None
-        if (raw_value or None) != formatted:
-            updates.append((formatted, row["rid"]))
+        formatted_cache[raw_value] = formatted
+        return formatted
 
-    if updates:
-        db.executemany(
-            "UPDATE exercises SET advanced_isolated_muscles = ? WHERE rowid = ?",
-            updates,
-        )
+    db.connection.create_function(
+        "normalize_advanced", 1, _format_advanced, deterministic=True
+    )
+    db.execute_query(
+        """
+        UPDATE exercises
+        SET advanced_isolated_muscles = normalize_advanced(advanced_isolated_muscles)
+        WHERE NULLIF(advanced_isolated_muscles, '')
+              IS NOT normalize_advanced(advanced_isolated_muscles)
+        """
+    )
 
 
 def normalize_and_rebuild_eim() -> None:
     """Normalise legacy CSV labels then rebuild exercise_isolated_muscles."""
     with DatabaseHandler() as db:
+        configure_bulk_connection(db.connection)
         _exec_many(db, NORMALIZE_SQL)
         _normalize_existing_rows(db)
         db.execute_query(
@@ -114,6 +128,8 @@ def normalize_and_rebuild_eim() -> None:
             """
         )
         _exec_many(db, REBUILD_EIM_SQL)
+    # Cached filter results and dropdown values may name rewritten labels
+    invalidate_cache('exercises')
 
 
 if __name__ == "__main__":  # pragma: no cover - CLI entry point
@@ -2,7 +2,10 @@
 from __future__ import annotations
 
 import re
-from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
 
 from utils.constants import (
     ADVANCED_SET,
@@ -17,15 +20,19 @@ from utils.constants import (
     UTILITY,
 )
 
-_WHITESPACE_RE = re.compile(r"\s+")
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]")
+_NON_ADVANCED_KEY_RE = re.compile(r"[^a-z0-9-]")
+_DASH_RUN_RE = re.compile(r"-+")
+# Semicolons are accepted as list separators alongside commas.
+_LIST_SEPARATORS = str.maketrans({";": ","})
 
 
 def clean_token(value: Optional[str]) -> str:
     """Trim the value and collapse internal whitespace without altering case."""
     if value is None:
         return ""
-    token = str(value).strip()
-    return _WHITESPACE_RE.sub(" ", token)
+    # str.split() with no separator strips and collapses whitespace in C.
+    return " ".join(str(value).split())
 
 
 def to_title(value: Optional[str]) -> str:
@@ -33,29 +40,35 @@ def to_title(value: Optional[str]) -> str:
     token = clean_token(value)
     if not token:
         return ""
-    pieces = _WHITESPACE_RE.sub(" ", token.replace("_", " ")).strip()
+    pieces = " ".join(token.replace("_", " ").split())
     # string.title() lowercases everything after the first char, which is fine here
-    titled = pieces.title()
-    return _WHITESPACE_RE.sub(" ", titled)
+    return pieces.title()
 
 
 def _canonical_key(value: str) -> str:
     """Collapse a string to a case-insensitive alphanumeric key."""
-    return re.sub(r"[^a-z0-9]", "", value.lower())
+    return _NON_ALNUM_RE.sub("", value.lower())
 
 
-def _build_lookup(mapping: Mapping[str, str]) -> Dict[str, str]:
-    return {_canonical_key(clean_token(key)): value for key, value in mapping.items()}
+def _build_lookup(mapping: Mapping[str, str]) -> Mapping[str, str]:
+    return _freeze(
+        {_canonical_key(clean_token(key)): value for key, value in mapping.items()}
+    )
+
+
+def _freeze(lookup: Dict[str, str]) -> Mapping[str, str]:
+    """Return a read-only view of a lookup table with interned keys."""
+    return MappingProxyType({sys.intern(key): value for key, value in lookup.items()})
 
 
 def _normalize_advanced_key(value: Optional[str]) -> str:
     token = clean_token(value)
     if not token:
         return ""
-    lowered = token.lower().replace("_", "-")
-    lowered = _WHITESPACE_RE.sub("-", lowered)
-    lowered = re.sub(r"[^a-z0-9-]", "-", lowered)
-    lowered = re.sub(r"-+", "-", lowered)
+    # clean_token leaves single spaces only, so a plain replace suffices.
+    lowered = token.lower().replace("_", "-").replace(" ", "-")
+    lowered = _NON_ADVANCED_KEY_RE.sub("-", lowered)
+    lowered = _DASH_RUN_RE.sub("-", lowered)
     return lowered.strip("-")
 
 
@@ -64,18 +77,25 @@ _MECHANIC_LOOKUP = _build_lookup(MECHANIC)
 _UTILITY_LOOKUP = _build_lookup(UTILITY)
 _DIFFICULTY_LOOKUP = _build_lookup(DIFFICULTY)
 
-_CANONICAL_MUSCLES = {_canonical_key(name): name for name in MUSCLE_GROUPS}
-_MUSCLE_ALIAS_LOOKUP: Dict[str, str] = {}
-for alias, canonical in MUSCLE_ALIAS.items():
-    canonical_target = _CANONICAL_MUSCLES.get(_canonical_key(canonical), canonical)
-    _MUSCLE_ALIAS_LOOKUP[_canonical_key(clean_token(alias))] = canonical_target
+# Canonical labels are interned so every normalised value shares one string object.
+_CANONICAL_MUSCLES = _freeze(
+    {_canonical_key(name): sys.intern(name) for name in MUSCLE_GROUPS}
+)
+_MUSCLE_ALIAS_LOOKUP = _freeze(
+    {
+        _canonical_key(clean_token(alias)): _CANONICAL_MUSCLES.get(
+            _canonical_key(canonical), sys.intern(canonical)
+        )
+        for alias, canonical in MUSCLE_ALIAS.items()
+    }
+)
 
-_ADVANCED_CANONICAL_LOOKUP = {
-    _normalize_advanced_key(token): token for token in ADVANCED_SET
-}
-_ADVANCED_SYNONYM_LOOKUP = {
-    _normalize_advanced_key(alias): target for alias, target in ADV_SYNONYMS.items()
-}
+_ADVANCED_CANONICAL_LOOKUP = _freeze(
+    {_normalize_advanced_key(token): token for token in ADVANCED_SET}
+)
+_ADVANCED_SYNONYM_LOOKUP = _freeze(
+    {_normalize_advanced_key(alias): target for alias, target in ADV_SYNONYMS.items()}
+)
 _ADVANCED_FORBIDDEN = {
     _normalize_advanced_key(token) for token in GROUP_LABELS_FORBIDDEN_IN_ADV
 }
@@ -83,17 +103,21 @@ _ADVANCED_FORBIDDEN = {
 
 def _normalise_equipment_key(value: str) -> str:
     token = clean_token(value)
-    token = token.replace("-", "_")
-    token = _WHITESPACE_RE.sub("_", token)
-    return token.lower()
+    return token.replace("-", "_").replace(" ", "_").lower()
 
 
-_EQUIPMENT_LOOKUP = {
+_EQUIPMENT_LOOKUP = _freeze({
     _normalise_equipment_key(key): value for key, value in EQUIPMENT_SYNONYMS.items()
-}
+})
 
 
+@lru_cache(maxsize=4096)
 def normalize_advanced_token(value: Optional[str]) -> Optional[str]:
+    """Resolve a single advanced muscle token to its canonical label.
+
+    Results are memoised: the catalogue repeats a small vocabulary of muscle
+    names across thousands of rows, so token lookups have a very high hit rate.
+    """
     key = _normalize_advanced_key(value)
     if not key or key in _ADVANCED_FORBIDDEN:
         return None
@@ -107,14 +131,20 @@ def normalize_advanced_muscles(value: Optional[Any]) -> List[str]:
     if value is None:
         return []
 
-    raw_tokens: List[str] = []
     if isinstance(value, str):
-        raw_tokens = split_csv(value.replace(";", ","))
-    elif isinstance(value, Iterable) and not isinstance(value, (str, bytes, bytearray)):
-        raw_tokens = [clean_token(token) for token in value]
-    else:
-        raw_tokens = split_csv(str(value).replace(";", ","))
+        return list(_normalize_advanced_string(value))
+    if isinstance(value, Iterable) and not isinstance(value, (bytes, bytearray)):
+        return _canonical_advanced_tokens(clean_token(token) for token in value)
+    return list(_normalize_advanced_string(str(value)))
+
+
+@lru_cache(maxsize=8192)
+def _normalize_advanced_string(value: str) -> Tuple[str, ...]:
+    """Memoised list normalisation; catalogue rows repeat the same muscle strings."""
+    return tuple(_canonical_advanced_tokens(split_csv(value.translate(_LIST_SEPARATORS))))
 
+
+def _canonical_advanced_tokens(raw_tokens: Iterable[str]) -> List[str]:
     seen: set[str] = set()
     normalized: List[str] = []
     for token in raw_tokens:
@@ -175,8 +205,9 @@ def normalize_equipment(value: Optional[str]) -> Optional[str]:
     return "_".join(titled_parts)
 
 
+@lru_cache(maxsize=4096)
 def normalize_muscle(value: Optional[str]) -> Optional[str]:
-    """Map aliases to canonical muscle groups."""
+    """Map aliases to canonical muscle groups (memoised per raw label)."""
     token = clean_token(value)
     if not token:
         return None
@@ -188,14 +219,23 @@ def normalize_muscle(value: Optional[str]) -> Optional[str]:
         return _CANONICAL_MUSCLES[key]
 
     fallback = token.replace("_", " ")
-    return to_title(fallback)
+    return sys.intern(to_title(fallback))
+
+
+# Labels that normalize_muscle already leaves untouched; bulk passes can skip them.
+CANONICAL_MUSCLE_LABELS = frozenset(
+    label
+    for label in {*_CANONICAL_MUSCLES.values(), *_MUSCLE_ALIAS_LOOKUP.values()}
+    if normalize_muscle(label) == label
+)
 
 
 def split_csv(text: Optional[str]) -> List[str]:
     """Split a comma-separated string into clean tokens."""
     if not text:
         return []
-    parts = [clean_token(part) for part in text.split(",")]
+    # Inline clean_token: split()/join collapses whitespace without a call per part.
+    parts = (" ".join(part.split()) for part in text.split(","))
     return [part for part in parts if part]
 
 
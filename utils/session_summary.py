@@ -77,12 +77,15 @@ def calculate_session_summary(
         query += " AND us.routine = ?"
         params.append(routine)
 
+    # DATE() normalizes 'T' separators and UTC offsets in created_at. The raw
+    # range, a day wider to allow for offsets, lets idx_workout_log_created_at
+    # seek to the window before DATE() applies the exact day boundary.
     if start_date:
-        query += " AND wl.created_at IS NOT NULL AND DATE(wl.created_at) >= DATE(?)"
-        params.append(start_date)
+        query += " AND wl.created_at >= DATE(?, '-1 day') AND DATE(wl.created_at) >= DATE(?)"
+        params.extend((start_date, start_date))
     if end_date:
-        query += " AND wl.created_at IS NOT NULL AND DATE(wl.created_at) <= DATE(?)"
-        params.append(end_date)
+        query += " AND wl.created_at < DATE(?, '+2 days') AND DATE(wl.created_at) <= DATE(?)"
+        params.extend((end_date, end_date))
 
     query += " ORDER BY us.routine, wl.created_at"
 
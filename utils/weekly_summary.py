@@ -32,10 +32,19 @@ EFFECTIVE_STATUS_MAP = {
 }
 
 
+def _fetch_all(query: str, db: Optional[DatabaseHandler] = None) -> List[Dict[str, Any]]:
+    """Run ``query`` on ``db`` when given, otherwise on a short-lived connection."""
+    if db is not None:
+        return db.fetch_all(query)
+    with DatabaseHandler() as handler:
+        return handler.fetch_all(query)
+
+
 def calculate_weekly_summary(
     method: Optional[str] = None,
     counting_mode: CountingMode = CountingMode.EFFECTIVE,
     contribution_mode: ContributionMode = ContributionMode.TOTAL,
+    db: Optional[DatabaseHandler] = None,
 ) -> Dict[str, Dict[str, Any]]:
     """Aggregate weighted weekly set counts per muscle group with effective sets.
 
@@ -45,6 +54,7 @@ def calculate_weekly_summary(
             existing callers do not raise ``TypeError``.
         counting_mode: RAW or EFFECTIVE set counting mode.
         contribution_mode: DIRECT_ONLY or TOTAL muscle contribution mode.
+        db: Optional open handler to reuse instead of opening a new connection.
         
     Returns:
         Dictionary mapping muscle groups to their volume statistics including:
@@ -75,8 +85,7 @@ def calculate_weekly_summary(
         JOIN exercises e ON us.exercise = e.exercise_name
     """
 
-    with DatabaseHandler() as db:
-        rows = db.fetch_all(query)
+    rows = _fetch_all(query, db)
 
     # Track both effective and raw totals
     effective_totals = defaultdict(lambda: {'sets': 0.0, 'reps': 0.0, 'volume': 0.0})
@@ -211,7 +220,7 @@ def calculate_weekly_summary(
     return dict(sorted(summary.items()))
 
 
-def calculate_exercise_categories() -> List[Dict[str, Any]]:
+def calculate_exercise_categories(db: Optional[DatabaseHandler] = None) -> List[Dict[str, Any]]:
     """Count distinct exercises per canonical classification bucket."""
     query = """
         SELECT
@@ -224,8 +233,7 @@ def calculate_exercise_categories() -> List[Dict[str, Any]]:
         JOIN exercises e ON us.exercise = e.exercise_name
     """
 
-    with DatabaseHandler() as db:
-        rows = db.fetch_all(query)
+    rows = _fetch_all(query, db)
 
     categories = {
         'Mechanic': defaultdict(set),
@@ -260,7 +268,7 @@ def calculate_exercise_categories() -> List[Dict[str, Any]]:
     return results
 
 
-def calculate_isolated_muscles_stats() -> List[Dict[str, Any]]:
+def calculate_isolated_muscles_stats(db: Optional[DatabaseHandler] = None) -> List[Dict[str, Any]]:
     """
     Calculate statistics for advanced isolated muscles using the mapping table.
     Assumes tables: user_selection us, exercises e, exercise_isolated_muscles eim.
@@ -279,8 +287,7 @@ def calculate_isolated_muscles_stats() -> List[Dict[str, Any]]:
     ORDER BY eim.muscle ASC
     """
     try:
-        with DatabaseHandler() as db:
-            return db.fetch_all(query)
+        return _fetch_all(query, db)
     except Exception as e:
         print(f"Error calculating isolated muscles stats: {e}")
         return []
@@ -1,31 +1,34 @@
 from .database import DatabaseHandler
 
+# Shared by get_workout_logs and the /export_workout_log download
+WORKOUT_LOGS_QUERY = """
+SELECT 
+    id,
+    routine,
+    exercise,
+    planned_sets,
+    planned_min_reps,
+    planned_max_reps,
+    planned_rir,
+    planned_rpe,
+    planned_weight,
+    scored_min_reps,
+    scored_max_reps,
+    scored_rir,
+    scored_rpe,
+    scored_weight,
+    last_progression_date,
+    created_at
+FROM workout_log 
+ORDER BY routine, exercise
+"""
+
+
 def get_workout_logs():
     """Fetch all workout log entries."""
-    query = """
-    SELECT 
-        id,
-        routine,
-        exercise,
-        planned_sets,
-        planned_min_reps,
-        planned_max_reps,
-        planned_rir,
-        planned_rpe,
-        planned_weight,
-        scored_min_reps,
-        scored_max_reps,
-        scored_rir,
-        scored_rpe,
-        scored_weight,
-        last_progression_date,
-        created_at
-    FROM workout_log 
-    ORDER BY routine, exercise
-    """
     try:
         with DatabaseHandler() as db:
-            return db.fetch_all(query)
+            return db.fetch_all(WORKOUT_LOGS_QUERY)
     except Exception as e:
         print(f"Error fetching workout logs: {e}")
         return []